@@ -0,0 +1,376 @@
+# ----------------------------------------------------
+# Layanan HTTP JSON lokal untuk angka-angka di balik dashboard. Perhitungan
+# memakai kode yang sama dengan dashboard (IngestState: rollup cube, momen
+# korelasi, statistik cukup regresi), jadi tidak ada yang dihitung ulang dari
+# baris mentah per permintaan.
+#
+# Endpoint (filter opsional lewat query string berupa kode, mis.
+# ?season=1,2&weathersit=1&weekday=1,2,3,4,5&yr=0&holiday=0):
+#   GET  /health               status, versi data, statistik cache
+#   GET  /season-averages      rata-rata cnt harian per musim
+#   GET  /hour-weekday-pivot   rata-rata cnt per jam x hari
+#   GET  /correlation          matriks korelasi kolom cuaca dan cnt
+#   POST /predict              prediksi regresi cuaca untuk banyak baris
+#        body: {"rows": [{"weathersit": 1, "temp": 0.3, ...}, ...]} atau
+#              kolom: {"weathersit": [...], "temp": [...], ...}
+#
+# Respons GET disimpan di cache dengan TTL; kuncinya memuat versi data,
+# sehingga cache otomatis basi ketika file sumber berubah (dataset dimuat
+# ulang) atau batch baru ditambahkan ke IngestState.
+#
+# Cara pakai (dari folder dashboard):
+#   python api.py [folder-data] [--host 127.0.0.1] [--port 8502] [--ttl 60]
+# ----------------------------------------------------
+import argparse
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from dataset_store import load_frame, source_fingerprint
+from figure_cache import filters_key
+from filter_index import SEASON_LABELS, WEEKDAY_LABELS
+from incremental import CORRELATION_COLUMNS, REGRESSION_FEATURES, IngestState, RunningRegression
+
+FILTER_COLUMNS = ('weekday', 'season', 'weathersit', 'yr', 'holiday')
+CACHE_TTL = 60
+CACHE_ENTRIES = 1024
+# Selang minimum antar pemeriksaan perubahan file sumber
+CHECK_SECONDS = 2.0
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+
+class RequestError(ValueError):
+    def __init__(self, message, status=400):
+        self.status = status
+        super().__init__(message)
+
+
+class ResponseCache:
+    # Cache LRU dengan TTL; entri juga dibuang jika versi datanya sudah lama
+
+    def __init__(self, ttl=CACHE_TTL, max_entries=CACHE_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self.entries.pop(key, None)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        if self.ttl <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+            return value, False
+        return value, True
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses,
+                    'ttl_seconds': self.ttl}
+
+
+# Fungsi untuk membaca filter dari query string: ?season=1,2&weekday=0,6
+def parse_filters(query):
+    params = parse_qs(query)
+    unknown = [name for name in params if name not in FILTER_COLUMNS]
+    if unknown:
+        raise RequestError("parameter tidak dikenal: %s" % ', '.join(unknown))
+    filters = {name: None for name in FILTER_COLUMNS}
+    for name, values in params.items():
+        try:
+            codes = [int(code) for value in values for code in value.split(',') if code]
+        except ValueError:
+            raise RequestError("%s harus berupa daftar kode bilangan bulat" % name)
+        filters[name] = tuple(sorted(set(codes))) or None
+    return filters
+
+
+# NaN/inf tidak valid di JSON: diganti null
+def _values(array):
+    array = np.asarray(array, dtype=np.float64)
+    return np.where(np.isfinite(array), array, None).tolist()
+
+
+# Fungsi untuk mengubah body /predict menjadi matriks fitur (n x k)
+def feature_matrix(payload, features=REGRESSION_FEATURES):
+    if isinstance(payload, dict) and 'rows' in payload:
+        payload = payload['rows']
+    try:
+        if isinstance(payload, list) and not payload:
+            # {"rows": []}: tidak ada baris, hasilnya prediksi kosong
+            X = np.empty((0, len(features)))
+        elif isinstance(payload, dict) and all(isinstance(payload.get(name), list) for name in features):
+            # Format kolom: langsung menjadi array tanpa DataFrame perantara
+            X = np.column_stack([np.asarray(payload[name], dtype=np.float64) for name in features])
+        else:
+            frame = pd.DataFrame(payload)
+            missing = [name for name in features if name not in frame.columns]
+            if missing:
+                raise RequestError("kolom fitur tidak ditemukan: %s" % ', '.join(missing))
+            X = frame[list(features)].to_numpy(dtype=np.float64)
+        # Nilai bersarang (mis. {"temp": [[0.1, 0.2]]}) menghasilkan bentuk lain
+        if X.ndim != 2 or X.shape[1] != len(features):
+            raise RequestError("setiap baris harus berisi tepat satu angka per fitur: %s"
+                               % ', '.join(features))
+    except RequestError:
+        raise
+    except (TypeError, ValueError) as e:
+        raise RequestError("body tidak bisa dibaca sebagai baris fitur angka: %s" % e)
+    if not np.isfinite(X).all():
+        raise RequestError("nilai fitur tidak boleh kosong atau tak hingga")
+    return X
+
+
+class DashboardService:
+    # Dataset, state berjalan dan cache respons untuk satu folder data
+
+    def __init__(self, directory='.', ttl=CACHE_TTL, check_seconds=CHECK_SECONDS):
+        self.day_path = os.path.join(directory, 'day.csv')
+        self.hour_path = os.path.join(directory, 'hour.csv')
+        self.cache = ResponseCache(ttl)
+        self.check_seconds = check_seconds
+        self.reloads = 0
+        self.load_error = None
+        self.rejected = None
+        self.lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        day_df = load_frame(self.day_path, table='day')
+        hour_df = load_frame(self.hour_path, table='hour')
+        self.state = IngestState(day_df, hour_df)
+        self.checked = time.monotonic()
+        self.cache.clear()
+
+    # Fungsi untuk memuat ulang dataset jika file sumber berubah. Pemeriksaan
+    # memakai ukuran/mtime (hash hanya dihitung jika keduanya berubah) dan
+    # dibatasi paling sering sekali per check_seconds.
+    def refresh(self):
+        if time.monotonic() - self.checked < self.check_seconds:
+            return False
+        with self.lock:
+            if time.monotonic() - self.checked < self.check_seconds:
+                return False
+            self.checked = time.monotonic()
+            try:
+                # File bisa hilang sesaat (mis. sedang diganti lewat rename)
+                current = (source_fingerprint(self.day_path), source_fingerprint(self.hour_path))
+            except OSError as e:
+                self.load_error = str(e)
+                return False
+            if current == self.state.fingerprint:
+                # File dikembalikan ke versi yang sedang dilayani
+                self.load_error = self.rejected = None
+                return False
+            # File yang sudah ditolak tidak dimuat ulang sampai berubah lagi
+            if current == self.rejected:
+                return False
+            try:
+                self._load()
+            except (OSError, ValueError) as e:
+                # File baru tidak valid (mis. gagal validasi skema): tetap
+                # layani data lama dan laporkan lewat /health
+                self.load_error = str(e)
+                self.rejected = current
+                return False
+            self.load_error = None
+            self.rejected = None
+            self.reloads += 1
+            return True
+
+    # Setiap permintaan memakai satu snapshot IngestState dari awal sampai
+    # akhir, meskipun dataset dimuat ulang atau batch baru masuk di tengahnya
+    @staticmethod
+    def _frames(snapshot, filters):
+        day_df, hour_df = snapshot.frames()
+        return snapshot.day_index.apply(day_df, filters), snapshot.hour_index.apply(hour_df, filters)
+
+    def health(self, snapshot, filters):
+        return {'status': 'ok', 'data_version': list(snapshot.data_version),
+                'reloads': self.reloads, 'load_error': self.load_error, 'cache': self.cache.stats()}
+
+    def season_averages(self, snapshot, filters):
+        averages = snapshot.day_cube.frame('cnt', ('season',), where=filters)
+        return {'season': averages.index.tolist(),
+                'label': [SEASON_LABELS[code] for code in averages.index],
+                'cnt': _values(averages)}
+
+    def hour_weekday_pivot(self, snapshot, filters):
+        pivot = snapshot.hour_cube.frame('cnt', ('hr', 'weekday'), where=filters)
+        return {'hr': pivot.index.tolist(), 'weekday': pivot.columns.tolist(),
+                'weekday_label': [WEEKDAY_LABELS[code] for code in pivot.columns],
+                'cnt': [_values(row) for row in pivot.to_numpy()]}
+
+    # Tanpa filter: dari momen berjalan; dengan filter: dari baris terpilih
+    # (sama seperti SectionContext.correlation di dashboard)
+    def correlation(self, snapshot, filters):
+        if any(filters.values()):
+            matrix = self._frames(snapshot, filters)[0][list(CORRELATION_COLUMNS)].corr()
+        else:
+            matrix = snapshot.moments.corr()
+        return {'columns': list(matrix.columns), 'corr': [_values(row) for row in matrix.to_numpy()]}
+
+    # Model regresi per versi data dan filter disimpan di cache yang sama
+    def regression(self, snapshot, filters):
+        if not any(filters.values()):
+            return snapshot.regression
+        model, _ = self.cache.get_or_compute(
+            ('model', snapshot.data_version, filters_key(filters)),
+            lambda: RunningRegression().update(self._frames(snapshot, filters)[0]))
+        return model
+
+    def predict(self, snapshot, filters, payload):
+        model = self.regression(snapshot, filters)
+        if not model.n:
+            raise RequestError("tidak ada data untuk filter yang dipilih", 422)
+        beta = model.solve()
+        predictions = beta[0] + feature_matrix(payload, model.features) @ beta[1:]
+        return {'features': list(model.features), 'intercept': float(beta[0]),
+                'coefficients': _values(beta[1:]), 'predictions': predictions.tolist()}
+
+    ROUTES = {
+        '/health': 'health',
+        '/season-averages': 'season_averages',
+        '/hour-weekday-pivot': 'hour_weekday_pivot',
+        '/correlation': 'correlation',
+    }
+
+    # Fungsi utama untuk GET: kembalikan (body JSON dalam byte, cache hit?)
+    def get(self, path, query):
+        if path not in self.ROUTES:
+            raise RequestError("endpoint tidak ditemukan: %s" % path, 404)
+        self.refresh()
+        filters = parse_filters(query)
+        snapshot = self.state.snapshot()
+        handler = getattr(self, self.ROUTES[path])
+        if path == '/health':
+            return json.dumps(handler(snapshot, filters)).encode(), False
+        key = (path, snapshot.data_version, filters_key(filters))
+        return self.cache.get_or_compute(key, lambda: json.dumps(handler(snapshot, filters)).encode())
+
+    def post(self, path, query, body):
+        if path != '/predict':
+            raise RequestError("endpoint tidak ditemukan: %s" % path, 404)
+        self.refresh()
+        try:
+            payload = json.loads(body)
+        except ValueError as e:
+            raise RequestError("body bukan JSON yang valid: %s" % e)
+        return json.dumps(self.predict(self.state.snapshot(), parse_filters(query), payload)).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    # Keep-alive agar klien bisa memakai ulang koneksi; tanpa Nagle, header
+    # dan body yang ditulis terpisah tidak tertahan delayed ACK (~40 ms)
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    service = None
+    quiet = True
+
+    def _send(self, status, body, cache=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if cache is not None:
+            self.send_header('X-Cache', 'hit' if cache else 'miss')
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Panjang body dari header Content-Length. Jika tidak valid atau terlalu
+    # besar, body tidak dibaca, jadi koneksi ditutup setelah respons error
+    def _content_length(self):
+        value = (self.headers.get('Content-Length') or '0').strip()
+        length = int(value) if value.isascii() and value.isdigit() else -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            self.close_connection = True
+            if length < 0:
+                raise RequestError("Content-Length tidak valid: %r" % value)
+            raise RequestError("body terlalu besar", 413)
+        return length
+
+    def _handle(self, method):
+        url = urlsplit(self.path)
+        try:
+            if method == 'GET':
+                body, hit = self.service.get(url.path, url.query)
+                self._send(200, body, hit)
+            else:
+                length = self._content_length()
+                self._send(200, self.service.post(url.path, url.query, self.rfile.read(length)))
+        except RequestError as e:
+            self._send(e.status, json.dumps({'error': str(e)}).encode())
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+# Fungsi untuk membuat server (belum berjalan); port=0 memilih port bebas
+def make_server(service, host='127.0.0.1', port=8502, quiet=True):
+    handler = type('DashboardHandler', (Handler,), {'service': service, 'quiet': quiet})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Layanan JSON untuk agregat dashboard')
+    parser.add_argument('directory', nargs='?', default='.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--ttl', type=float, default=CACHE_TTL, help='TTL cache respons (detik), 0 = tanpa cache')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args(argv)
+
+    pd.set_option('mode.copy_on_write', True)
+    service = DashboardService(args.directory, args.ttl)
+    server = make_server(service, args.host, args.port, quiet=not args.verbose)
+    print("melayani di http://%s:%d" % server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
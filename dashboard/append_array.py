@@ -0,0 +1,45 @@
+# ----------------------------------------------------
+# Array numpy yang bisa diperpanjang tanpa menyalin isi lama, untuk indeks
+# yang dipakai bersama oleh beberapa snapshot IngestState (bitmap filter,
+# prefix sum indeks waktu). Data disimpan di buffer dengan kapasitas
+# cadangan (digandakan saat penuh) dan setiap versi hanya melihat
+# buffer[:length]. Versi baru menulis di belakang panjang versi lama, jadi
+# isi yang dilihat versi lama tidak berubah dan biaya perpanjangan sebanding
+# dengan jumlah elemen baru (amortized).
+# ----------------------------------------------------
+import numpy as np
+
+
+class AppendArray:
+    def __init__(self, values):
+        values = np.asarray(values)
+        # Disalin ke buffer dengan cadangan 25%, sehingga batch pertama tidak
+        # langsung memicu penyalinan dan array asal tidak pernah ditulis
+        self._buffer = np.empty((len(values) + len(values) // 4 + 16,) + values.shape[1:], dtype=values.dtype)
+        self._buffer[:len(values)] = values
+        self._used = [len(values)]
+        self.length = len(values)
+
+    @property
+    def values(self):
+        return self._buffer[:self.length]
+
+    # Versi baru: `replace` elemen terakhir diganti, lalu `values` ditambahkan.
+    # `replace` hanya boleh menyentuh elemen yang tidak dibaca versi lama
+    # (mis. bit sisa pada byte terakhir bitmap yang sudah di-pack).
+    def extend(self, values, replace=0):
+        values = np.asarray(values, dtype=self._buffer.dtype)
+        start = self.length - replace
+        end = start + len(values)
+        buffer, used = self._buffer, self._used
+        # Buffer penuh, atau versi ini bukan yang terakhir diperpanjang
+        if end > len(buffer) or used[0] != self.length:
+            buffer = np.empty((2 * end + 16,) + self._buffer.shape[1:], dtype=self._buffer.dtype)
+            buffer[:start] = self._buffer[:start]
+            used = [start]
+        buffer[start:end] = values
+        used[0] = end
+
+        result = object.__new__(AppendArray)
+        result._buffer, result._used, result.length = buffer, used, end
+        return result
@@ -0,0 +1,264 @@
+# ----------------------------------------------------
+# Benchmark skala besar dengan data sintetis (synthetic.py). Untuk setiap
+# ukuran data, setiap tahap pipeline dashboard diukur terpisah: waktu
+# (wall dan CPU) dan puncak alokasi memori (tracemalloc, pada putaran
+# kedua agar overhead tracemalloc tidak mengotori waktu). Hasil ditulis
+# ke file JSON, lalu dicetak kemiringan log-log waktu terhadap jumlah baris
+# untuk melihat tahap mana yang paling dulu berhenti berskala linear.
+#
+# Cara pakai (dari folder dashboard):
+#   python benchmark.py --rows 1e5 1e6 1e7 [--cities 20] [--stages load_csv pivot ...]
+#                       [--output benchmark.json] [--workdir .benchmark_data] [--no-memory]
+# ----------------------------------------------------
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import shutil
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import schema
+import synthetic
+from dataset_store import build_cache, load_frame
+from filter_index import FilterIndex
+from incremental import CORRELATION_COLUMNS, RunningRegression
+from rollup import RollupCube
+from stats_kernel import column_stats
+
+KDE_POINTS = 200
+HISTOGRAM_BINS = 30
+NUMERIC_COLUMNS = ('temp', 'atemp', 'hum', 'windspeed', 'casual', 'registered', 'cnt')
+BENCHMARK_FILTERS = {'season': [2, 3], 'weathersit': [1, 2], 'workingday': [1]}
+
+
+# ----------------------------------------------------
+# Tahap-tahap yang diukur. Setiap tahap menerima dict `data` berisi path
+# CSV dan frame yang sudah dimuat, dan boleh menambahkan hasilnya ke sana.
+# ----------------------------------------------------
+# Frame diberi skema bertipe seperti di dashboard (load_frame(table=...)),
+# sehingga tahap berikutnya mengukur tipe data yang benar-benar dipakai
+def stage_load_csv(data):
+    data['hour'] = schema.apply(pd.read_csv(data['hour_path']), 'hour')
+    data['day'] = schema.apply(pd.read_csv(data['day_path']), 'day')
+
+
+def stage_cache_build(data):
+    build_cache(data['hour_path'], data['hour'], schema=schema.schema_id('hour'))
+    build_cache(data['day_path'], data['day'], schema=schema.schema_id('day'))
+
+
+def stage_load_cache(data):
+    hour = load_frame(data['hour_path'], table='hour')
+    # Sentuh kolom numerik agar halaman memmap benar-benar terbaca
+    for name in NUMERIC_COLUMNS:
+        np.asarray(hour[name]).sum()
+
+
+def stage_missing_scan(data):
+    data['hour'].isnull().sum()
+    data['day'].isnull().sum()
+
+
+def stage_histogram(data):
+    np.histogram(data['hour']['cnt'], bins=HISTOGRAM_BINS)
+    np.histogram(data['day']['cnt'], bins=HISTOGRAM_BINS)
+
+
+def stage_kde(data):
+    from scipy.stats import gaussian_kde
+
+    values = data['hour']['temp'].to_numpy()
+    gaussian_kde(values).evaluate(np.linspace(values.min(), values.max(), KDE_POINTS))
+
+
+# Semua kolom numerik sekaligus: momen, korelasi, histogram, KDE
+def stage_stats_kernel(data):
+    stats = column_stats(data['hour'])
+    for name in ('temp', 'hum', 'windspeed'):
+        stats.kde(name, scale='count')
+
+
+def stage_correlation(data):
+    data['hour'][list(CORRELATION_COLUMNS)].corr()
+
+
+def stage_regression(data):
+    data['regression'] = RunningRegression().update(data['hour'])
+    data['regression'].solve()
+
+
+def stage_pivot(data):
+    data['pivot'] = data['hour'].pivot_table(index='hr', columns='weekday', values='cnt', aggfunc='mean')
+
+
+def stage_rollup_cube(data):
+    RollupCube(data['hour']).frame('cnt', ('hr', 'weekday'))
+
+
+def stage_groupby(data):
+    hour = data['hour']
+    hour.groupby('season')['cnt'].mean()
+    hour.groupby('weathersit')['cnt'].mean()
+    hour.groupby(['workingday', 'holiday'])['cnt'].agg(['mean', 'median'])
+    if 'city' in hour.columns:
+        hour.groupby(['city', 'yr'])['cnt'].sum()
+
+
+def stage_filter_index(data):
+    FilterIndex(data['hour']).apply(data['hour'], BENCHMARK_FILTERS)
+
+
+def stage_render(data):
+    import matplotlib
+    matplotlib.use('Agg')
+    import figures
+    from figure_cache import render_figure
+
+    counts, edges = np.histogram(data['day']['cnt'], bins=HISTOGRAM_BINS)
+    render_figure(figures.cnt_histogram(counts, edges))
+    render_figure(figures.hour_weekday_heatmap(data['pivot']))
+    render_figure(figures.season_boxplot(data['day']))
+    stats = column_stats(data['day'], ['temp'])
+    render_figure(figures.distribution(*stats.histogram('temp'), *stats.kde('temp', scale='count'),
+                                       'orange', 'Distribusi Suhu', 'Suhu'))
+
+
+STAGES = {
+    'load_csv': stage_load_csv,
+    'cache_build': stage_cache_build,
+    'load_cache': stage_load_cache,
+    'missing_scan': stage_missing_scan,
+    'histogram': stage_histogram,
+    'kde': stage_kde,
+    'stats_kernel': stage_stats_kernel,
+    'correlation': stage_correlation,
+    'regression': stage_regression,
+    'pivot': stage_pivot,
+    'rollup_cube': stage_rollup_cube,
+    'groupby': stage_groupby,
+    'filter_index': stage_filter_index,
+    'render': stage_render,
+}
+# Tahap yang hasilnya dibutuhkan tahap lain, selalu dijalankan
+REQUIRED_STAGES = ('load_csv', 'pivot')
+
+
+def _timed(fn, data):
+    gc.collect()
+    cpu = time.process_time()
+    start = time.perf_counter()
+    fn(data)
+    return time.perf_counter() - start, time.process_time() - cpu
+
+
+def _peak_memory(fn, data):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn(data)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# Fungsi untuk menjalankan semua tahap pada satu ukuran data
+def run_size(rows, stages, workdir, cities=None, seed=0, memory=True, profile=None):
+    directory = os.path.join(workdir, 'rows-%d' % rows)
+    shutil.rmtree(directory, ignore_errors=True)
+    start = time.perf_counter()
+    day_path, hour_path = synthetic.write_dataset(directory, rows, cities, seed, profile)
+    generate_seconds = time.perf_counter() - start
+
+    data = {'day_path': day_path, 'hour_path': hour_path}
+    results = []
+    for name in STAGES:
+        if name not in stages and name not in REQUIRED_STAGES:
+            continue
+        wall, cpu = _timed(STAGES[name], data)
+        row = {'rows': rows, 'stage': name, 'wall_seconds': wall, 'cpu_seconds': cpu}
+        if memory:
+            row['peak_bytes'] = _peak_memory(STAGES[name], data)
+        if name in stages:
+            results.append(row)
+            print("%12d %-14s %10.3f %10.3f %12s" % (
+                rows, name, wall, cpu,
+                '%.1f MB' % (row['peak_bytes'] / 2 ** 20) if memory else '-'))
+
+    dataset = {
+        'rows': rows,
+        'day_rows': len(data['day']),
+        'cities': int(data['hour']['city'].max() + 1) if 'city' in data['hour'] else 1,
+        'csv_bytes': os.path.getsize(hour_path) + os.path.getsize(day_path),
+        'frame_bytes': int(data['hour'].memory_usage(deep=True).sum()),
+        'generate_seconds': generate_seconds,
+    }
+    shutil.rmtree(directory, ignore_errors=True)
+    return dataset, results
+
+
+# Kemiringan log(waktu) terhadap log(baris): ~1 berarti linear, >1 berarti
+# tahap itu tumbuh lebih cepat dari datanya
+def scaling_slopes(results):
+    slopes = {}
+    for stage in dict.fromkeys(r['stage'] for r in results):
+        points = [(r['rows'], r['wall_seconds']) for r in results
+                  if r['stage'] == stage and r['wall_seconds'] > 0]
+        if len(points) > 1:
+            x = np.log([p[0] for p in points])
+            y = np.log([p[1] for p in points])
+            slopes[stage] = float(np.polyfit(x, y, 1)[0])
+    return slopes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark dashboard dengan data sintetis')
+    parser.add_argument('--rows', nargs='+', type=float, default=[1e5, 1e6])
+    parser.add_argument('--cities', type=int, default=None)
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark.json')
+    parser.add_argument('--workdir', default='.benchmark_data')
+    parser.add_argument('--no-memory', action='store_true')
+    args = parser.parse_args(argv)
+
+    profile = synthetic.load_profile()
+    datasets, results = [], []
+    print("%12s %-14s %10s %10s %12s" % ('baris', 'tahap', 'wall (s)', 'cpu (s)', 'puncak mem'))
+    for rows in args.rows:
+        dataset, stage_results = run_size(int(rows), args.stages, args.workdir, args.cities,
+                                          args.seed, not args.no_memory, profile)
+        datasets.append(dataset)
+        results.extend(stage_results)
+    shutil.rmtree(args.workdir, ignore_errors=True)
+
+    slopes = scaling_slopes(results)
+    if slopes:
+        print("\nkemiringan log-log (1 = linear):")
+        for stage, slope in sorted(slopes.items(), key=lambda item: -item[1]):
+            print("  %-14s %5.2f" % (stage, slope))
+
+    report = {
+        'environment': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'cpu_count': os.cpu_count(),
+            'machine': platform.machine(),
+        },
+        'datasets': datasets,
+        'stages': results,
+        'scaling_slopes': {k: (v if math.isfinite(v) else None) for k, v in slopes.items()},
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print("\nhasil ditulis ke %s" % args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,213 @@
+# ----------------------------------------------------
+# Mode out-of-core: statistik dashboard dihitung dari file yang terlalu
+# besar untuk dimuat sebagai satu DataFrame. File dibaca per chunk (rentang
+# byte CSV, atau rentang baris cache kolom biner/memmap), setiap chunk
+# diringkas menjadi agregat parsial yang bisa digabung, lalu ringkasan
+# digabung berurutan:
+# - jumlah nilai hilang per kolom,
+# - histogram nilai cnt (ValueCounts),
+# - momen untuk matriks korelasi (RunningMoments),
+# - persamaan normal regresi (RunningRegression),
+# - rollup cube untuk pivot jam x hari dan ringkasan per kelompok.
+# Chunk diproses paralel di process pool. Urutan penggabungan tetap,
+# sehingga hasilnya tidak bergantung pada jumlah worker.
+#
+# Setiap chunk CSV diberi skema yang sama dengan dashboard (schema.py), dan
+# cache yang dibaca adalah cache bertipe milik load_frame(table=...), jadi
+# kedua jalur meringkas nilai yang identik. Tabel (day/hour) ditebak dari
+# header bila --table tidak diberikan.
+#
+# Cara pakai (dari folder dashboard):
+#   python chunked.py hour.csv [--table hour] [--workers 4] [--chunk-mb 64] [--no-cache] [--verify]
+# ----------------------------------------------------
+import argparse
+import io
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import schema
+from dataset_store import load_frame, read_cache, source_fingerprint
+from incremental import (CORRELATION_COLUMNS, REGRESSION_FEATURES, REGRESSION_TARGET,
+                         RunningMoments, RunningRegression, ValueCounts)
+from rollup import RollupCube
+
+CHUNK_BYTES = 64 * 1024 * 1024
+GROUP_COLUMNS = ('season', 'weathersit', 'workingday', 'holiday', 'yr', 'weekday')
+
+
+class ChunkSummary:
+    # Agregat parsial satu tabel (day atau hour) yang bisa digabung
+
+    def __init__(self, df):
+        self.columns = list(df.columns)
+        self.rows = len(df)
+        self.missing = df.isnull().sum().to_numpy()
+        self.cnt = ValueCounts().update(df['cnt']) if 'cnt' in df.columns else None
+        self.moments = None
+        if set(CORRELATION_COLUMNS) <= set(df.columns):
+            self.moments = RunningMoments().update(df)
+        self.regression = None
+        if set(REGRESSION_FEATURES) | {REGRESSION_TARGET} <= set(df.columns):
+            self.regression = RunningRegression().update(df)
+        self.cube = RollupCube(df)
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.missing = self.missing + other.missing
+        for name in ('cnt', 'moments', 'regression', 'cube'):
+            if getattr(self, name) is not None:
+                getattr(self, name).merge(getattr(other, name))
+        return self
+
+    # Hasil akhir dengan bentuk yang sama seperti jalur in-memory
+    def missing_counts(self):
+        return pd.Series(self.missing, index=self.columns)
+
+    def cnt_histogram(self, bins=30):
+        return self.cnt.histogram(bins)
+
+    def correlation(self):
+        return self.moments.corr()
+
+    def hour_weekday_pivot(self):
+        return self.cube.frame('cnt', ('hr', 'weekday'))
+
+    # Ringkasan cnt per kelompok: banyak baris, total dan rata-rata
+    def group_summary(self, column, measure='cnt'):
+        return pd.DataFrame({
+            'count': self.cube.frame(measure, (column,), aggfunc='count').astype(np.int64),
+            'sum': self.cube.frame(measure, (column,), aggfunc='sum'),
+            'mean': self.cube.frame(measure, (column,)),
+        })
+
+
+# ----------------------------------------------------
+# Pembagian file menjadi tugas
+# ----------------------------------------------------
+# Rentang byte CSV yang dipotong tepat di batas baris
+def csv_ranges(path, chunk_bytes=CHUNK_BYTES):
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        header = f.readline()
+        boundaries = [f.tell()]
+        while boundaries[-1] < size:
+            f.seek(min(boundaries[-1] + chunk_bytes, size))
+            if f.tell() < size:
+                f.readline()
+            boundaries.append(f.tell())
+    columns = header.decode().strip().split(',')
+    return columns, list(zip(boundaries[:-1], boundaries[1:]))
+
+
+# Tabel skema dari nama kolom: hanya hour.csv yang punya kolom hr
+def table_of(columns):
+    return 'hour' if 'hr' in columns else 'day'
+
+
+def _summarize_csv_range(path, columns, table, start, stop):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(stop - start)
+    return ChunkSummary(schema.apply(pd.read_csv(io.BytesIO(data), header=None, names=columns), table))
+
+
+def _summarize_cache_range(path, sha256, schema_name, start, stop):
+    df = read_cache(path, sha256, schema=schema_name)
+    # Salin potongan memmap agar hanya rentang ini yang dibaca dari disk
+    return ChunkSummary(pd.DataFrame({c: np.array(df[c].to_numpy()[start:stop]) for c in df.columns}))
+
+
+def _cache_tasks(path, chunk_bytes, table):
+    sha256 = source_fingerprint(path)
+    schema_name = schema.schema_id(table)
+    try:
+        df = read_cache(path, sha256, schema=schema_name)
+    except (OSError, ValueError):
+        df = None
+    if df is None:
+        return None
+    row_bytes = max(1, sum(df[c].dtype.itemsize for c in df.columns))
+    step = max(1, chunk_bytes // row_bytes)
+    return [(_summarize_cache_range, (path, sha256, schema_name, start, min(start + step, len(df))))
+            for start in range(0, len(df), step)]
+
+
+# Fungsi utama: ringkasan seluruh file, dari cache kolom biner jika masih
+# valid, jika tidak langsung dari CSV
+def summarize(path, workers=None, chunk_bytes=CHUNK_BYTES, use_cache=True, table=None):
+    columns, ranges = csv_ranges(path, chunk_bytes)
+    table = table or table_of(columns)
+    tasks = _cache_tasks(path, chunk_bytes, table) if use_cache else None
+    if tasks is None:
+        tasks = [(_summarize_csv_range, (path, columns, table, start, stop)) for start, stop in ranges]
+
+    workers = workers or min(4, os.cpu_count() or 1)
+    if workers == 1 or len(tasks) == 1:
+        parts = [fn(*args) for fn, args in tasks]
+    else:
+        from resampling import get_pool
+        pool = get_pool(workers)
+        parts = [future.result() for future in [pool.submit(fn, *args) for fn, args in tasks]]
+
+    summary = parts[0]
+    for part in parts[1:]:
+        summary.merge(part)
+    return summary
+
+
+# Fungsi untuk membandingkan hasil out-of-core dengan jalur in-memory
+# (pandas + state berjalan yang dipakai dashboard)
+def compare_with_memory(path, summary, table=None):
+    df = load_frame(path, use_cache=False, table=table or table_of(summary.columns))
+    checks = {
+        'missing_counts': summary.missing_counts().equals(df.isnull().sum()),
+        'cnt_histogram': all(np.array_equal(a, b) for a, b in
+                             zip(summary.cnt_histogram(), np.histogram(df['cnt'], bins=30))),
+        'correlation': np.allclose(summary.correlation(), df[list(CORRELATION_COLUMNS)].corr(),
+                                   rtol=1e-12, atol=1e-12),
+        'regression': np.allclose(summary.regression.solve(),
+                                  RunningRegression().update(df).solve(), rtol=1e-9, atol=1e-9),
+    }
+    if 'hr' in df.columns:
+        pivot = df.pivot_table(index='hr', columns='weekday', values='cnt', aggfunc='mean')
+        checks['hour_weekday_pivot'] = np.array_equal(summary.hour_weekday_pivot().to_numpy(),
+                                                      pivot.to_numpy())
+    for column in GROUP_COLUMNS:
+        grouped = df.groupby(column)['cnt'].agg(['count', 'sum', 'mean'])
+        checks['group_' + column] = np.array_equal(
+            summary.group_summary(column).to_numpy(), grouped.to_numpy())
+    return checks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Statistik dashboard secara out-of-core')
+    parser.add_argument('path')
+    parser.add_argument('--table', choices=sorted(schema.SCHEMAS), default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-mb', type=float, default=CHUNK_BYTES / 2 ** 20)
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--verify', action='store_true')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    summary = summarize(args.path, args.workers, int(args.chunk_mb * 2 ** 20), not args.no_cache,
+                        args.table)
+    print("%d baris diringkas dalam %.2fs" % (summary.rows, time.perf_counter() - start))
+    print("\nNilai hilang:\n%s" % summary.missing_counts().to_string())
+    print("\nKorelasi:\n%s" % summary.correlation().round(3).to_string())
+    print("\nKoefisien regresi:\n%s" % summary.regression.coefficients().to_string())
+    for column in ('season', 'weathersit'):
+        print("\nRingkasan per %s:\n%s" % (column, summary.group_summary(column).to_string()))
+
+    if args.verify:
+        checks = compare_with_memory(args.path, summary, args.table)
+        print("\nPerbandingan dengan jalur in-memory:")
+        for name, ok in checks.items():
+            print("  %-20s %s" % (name, 'sama' if ok else 'BERBEDA'))
+
+
+if __name__ == '__main__':
+    main()
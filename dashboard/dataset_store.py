@@ -0,0 +1,242 @@
+# ----------------------------------------------------
+# Penyimpanan dataset dalam format kolom biner (satu file .npy per kolom).
+# CSV hanya di-parse sekali, lalu pemuatan berikutnya memakai memory-map.
+# Cache diberi kunci hash SHA-256 dari file sumber sehingga otomatis basi
+# ketika isi CSV berubah; jika cache hilang/basi kita kembali membaca CSV.
+# ----------------------------------------------------
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import schema
+
+CACHE_DIR = '.dataset_cache'
+CACHE_VERSION = 1
+HASH_CHUNK_SIZE = 1 << 20
+
+
+# Fungsi untuk menghitung hash SHA-256 dari sebuah file. file_digest
+# mengembalikan objek hash agar bisa dilanjutkan (mis. unduhan yang dilanjutkan).
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest
+
+
+def file_sha256(path):
+    return file_digest(path).hexdigest()
+
+
+def _cache_root(csv_path, cache_dir=None):
+    if cache_dir is not None:
+        return cache_dir
+    return os.path.join(os.path.dirname(os.path.abspath(csv_path)), CACHE_DIR)
+
+
+def _stem(csv_path):
+    return os.path.splitext(os.path.basename(csv_path))[0]
+
+
+def _pointer_path(csv_path, cache_dir=None):
+    return os.path.join(_cache_root(csv_path, cache_dir), _stem(csv_path) + '.json')
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+# Fungsi untuk mendapatkan hash file sumber. Hash hanya dihitung ulang jika
+# ukuran atau waktu modifikasi file berbeda dari yang tercatat di pointer.
+def source_fingerprint(csv_path, cache_dir=None):
+    stat = os.stat(csv_path)
+    pointer = _read_json(_pointer_path(csv_path, cache_dir))
+    if (pointer and pointer.get('size') == stat.st_size
+            and pointer.get('mtime_ns') == stat.st_mtime_ns):
+        return pointer['sha256']
+    return file_sha256(csv_path)
+
+
+# Satu entri per isi file dan skema (frame mentah dan frame bertipe ringkas
+# dari schema.py disimpan terpisah)
+def _entry_dir(csv_path, sha256, cache_dir=None, schema=None):
+    name = '%s-%s' % (_stem(csv_path), sha256[:16])
+    if schema:
+        name += '-' + schema
+    return os.path.join(_cache_root(csv_path, cache_dir), name)
+
+
+def _to_storable(series):
+    values = series.to_numpy()
+    if values.dtype == object:
+        # Kolom teks (mis. dteday) disimpan sebagai unicode lebar tetap
+        values = values.astype(str)
+    return values
+
+
+# Fungsi untuk menulis cache kolom biner dari sebuah DataFrame
+def build_cache(csv_path, df=None, sha256=None, cache_dir=None, schema=None):
+    if sha256 is None:
+        sha256 = file_sha256(csv_path)
+    if df is None:
+        df = pd.read_csv(csv_path)
+
+    root = _cache_root(csv_path, cache_dir)
+    os.makedirs(root, exist_ok=True)
+    entry_dir = _entry_dir(csv_path, sha256, cache_dir, schema)
+    tmp_dir = entry_dir + '.tmp-%d' % os.getpid()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    columns = []
+    for i, name in enumerate(df.columns):
+        values = _to_storable(df[name])
+        file_name = '%03d.npy' % i
+        np.save(os.path.join(tmp_dir, file_name), values, allow_pickle=False)
+        columns.append({'name': name, 'file': file_name, 'dtype': values.dtype.str})
+
+    meta = {'version': CACHE_VERSION, 'sha256': sha256, 'schema': schema, 'rows': len(df),
+            'columns': columns}
+    _write_json(os.path.join(tmp_dir, 'meta.json'), meta)
+
+    # Rename atomik: pembaca tidak pernah melihat cache yang setengah jadi
+    shutil.rmtree(entry_dir, ignore_errors=True)
+    os.replace(tmp_dir, entry_dir)
+
+    # Hapus cache lama dari file yang sama (isi file berbeda). Hanya nama
+    # persis <stem>-<16 hex>[-<skema>] yang cocok, sehingga cache hour.csv
+    # tidak menghapus cache hour-2012.csv
+    entry_name = re.compile(r'%s-([0-9a-f]{16})(-\w+-v\d+)?$' % re.escape(_stem(csv_path)))
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        match = entry_name.match(name)
+        if match and match.group(1) != sha256[:16] and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+
+    stat = os.stat(csv_path)
+    _write_json(_pointer_path(csv_path, cache_dir), {
+        'sha256': sha256, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+    })
+    return entry_dir
+
+
+# Fungsi untuk membaca cache kolom biner dengan memory-map.
+# Mengembalikan None jika cache tidak ada atau tidak cocok dengan hash sumber.
+def read_cache(csv_path, sha256, cache_dir=None, schema=None):
+    entry_dir = _entry_dir(csv_path, sha256, cache_dir, schema)
+    meta = _read_json(os.path.join(entry_dir, 'meta.json'))
+    if (not meta or meta.get('version') != CACHE_VERSION or meta.get('sha256') != sha256
+            or meta.get('schema') != schema):
+        return None
+
+    data = {}
+    for column in meta['columns']:
+        values = np.load(os.path.join(entry_dir, column['file']), mmap_mode='r')
+        if len(values) != meta['rows']:
+            return None
+        data[column['name']] = values
+    # copy=False menjaga setiap kolom tetap berupa memmap (tanpa konsolidasi)
+    return pd.DataFrame(data, copy=False)
+
+
+# Fungsi utama untuk memuat dataset: pakai cache jika valid, jika tidak
+# baca CSV lalu tulis cache untuk pemuatan berikutnya. Dengan table='day' atau
+# 'hour', skema dari schema.py (validasi + tipe ringkas) diterapkan sekali
+# sebelum cache ditulis, sehingga pemuatan berikutnya langsung bertipe ringkas.
+def load_frame(csv_path, cache_dir=None, use_cache=True, table=None):
+    def parse():
+        df = pd.read_csv(csv_path)
+        return schema.apply(df, table) if table else df
+
+    if not use_cache:
+        return parse()
+
+    schema_name = schema.schema_id(table) if table else None
+    sha256 = source_fingerprint(csv_path, cache_dir)
+    try:
+        df = read_cache(csv_path, sha256, cache_dir, schema_name)
+    except (OSError, ValueError):
+        df = None
+
+    if df is None:
+        parsed = parse()
+        try:
+            build_cache(csv_path, parsed, sha256, cache_dir, schema_name)
+            # Pakai memmap dari cache yang baru ditulis: halaman file dibagi
+            # oleh OS, bukan disalin ke heap proses
+            df = read_cache(csv_path, sha256, cache_dir, schema_name)
+        except OSError:
+            # Direktori read-only (mis. di Streamlit Cloud): tetap pakai CSV
+            pass
+        if df is None:
+            df = read_only(parsed)
+
+    df.attrs['fingerprint'] = sha256
+    return df
+
+
+# Fungsi untuk membuat salinan DataFrame yang kolomnya read-only, agar frame
+# yang dipakai bersama oleh banyak sesi tidak bisa diubah di tempat
+def read_only(df):
+    data = {}
+    for name in df.columns:
+        values = df[name].to_numpy(copy=True)
+        values.flags.writeable = False
+        data[name] = values
+    frame = pd.DataFrame(data, copy=False)
+    frame.attrs.update(df.attrs)
+    return frame
+
+
+# Fungsi untuk membandingkan waktu muat CSV dengan cache kolom biner. Dengan
+# table='day'/'hour' keduanya memakai skema ringkas seperti di dashboard.
+def compare_load_times(csv_path, repeat=5, cache_dir=None, table=None):
+    load_frame(csv_path, cache_dir, table=table)  # pastikan cache sudah tersedia
+
+    def best_of(fn):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            df = fn()
+            # Sentuh semua kolom agar halaman memmap benar-benar terbaca
+            for name in df.columns:
+                np.array(df[name], copy=True)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    csv_time = best_of(lambda: load_frame(csv_path, cache_dir, use_cache=False, table=table))
+    cache_time = best_of(lambda: load_frame(csv_path, cache_dir, table=table))
+    return {
+        'file': csv_path,
+        'csv_seconds': csv_time,
+        'cache_seconds': cache_time,
+        'speedup': csv_time / cache_time if cache_time else float('inf'),
+    }
+
+
+if __name__ == '__main__':
+    paths = sys.argv[1:] or ['day.csv', 'hour.csv']
+    for path in paths:
+        table = _stem(path)
+        result = compare_load_times(path, table=table if table in schema.SCHEMAS else None)
+        print("%(file)s: CSV %(csv_seconds).4fs, cache %(cache_seconds).4fs, "
+              "speedup %(speedup).1fx" % result)
@@ -0,0 +1,358 @@
+# ----------------------------------------------------
+# Lapisan unduhan dataset: paralel, terverifikasi checksum, bisa dilanjutkan.
+# - Semua file diunduh bersamaan lewat thread pool di atas satu Session
+#   (connection pool dipakai bersama).
+# - Unduhan dilewati jika ETag/ukuran/SHA-256 yang tersimpan masih cocok.
+#   Google Drive biasanya tidak mengirim ETag, jadi SHA-256 kedua file
+#   disematkan di GDRIVE_SHA256: file lokal yang cocok tidak diminta ulang
+#   sama sekali, dan unduhan baru diverifikasi terhadap hash tersebut. Jika
+#   file di Drive diganti, hash di GDRIVE_SHA256 juga harus diperbarui.
+# - Unduhan yang terputus dilanjutkan dengan header Range.
+# - File ditulis ke file sementara lalu di-rename secara atomik.
+# ----------------------------------------------------
+import email.utils
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from dataset_store import file_digest, file_sha256
+
+GDRIVE_URL = "https://docs.google.com/uc?export=download"
+MANIFEST_NAME = '.fetch_manifest.json'
+CHUNK_SIZE = 32768
+PART_SUFFIX = '.part'
+
+# ID file dari Google Drive
+GDRIVE_FILES = {
+    'day.csv': '1QE1baqT-k2dt4mzrLi6WHou6YuYigQB9',
+    'hour.csv': '1BQWbPKqHUY12IA-o7R-hTSkknFpohWlM',
+}
+GDRIVE_SHA256 = {
+    'day.csv': '537e98e2c8b8f53e3094d953f847788b1dc224764a4a1e538b3e1ec4e30dac8a',
+    'hour.csv': 'b03a2d02e8c10f435c43c7f0b358b7e34a003afea53dbc37f0183f2763295133',
+}
+
+
+class FetchError(Exception):
+    pass
+
+
+# Sumber unduhan: URL, parameter query, dan (opsional) SHA-256 yang diharapkan
+class Source:
+    def __init__(self, url, params=None, expected_sha256=None, gdrive=False):
+        self.url = url
+        self.params = params or {}
+        self.expected_sha256 = expected_sha256
+        self.gdrive = gdrive
+
+
+def gdrive_source(file_id, expected_sha256=None):
+    return Source(GDRIVE_URL, {'id': file_id}, expected_sha256, gdrive=True)
+
+
+# Fungsi untuk membuat Session dengan connection pool yang cukup untuk semua worker
+def make_session(pool_size=4):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class Manifest:
+    # Catatan ETag/ukuran/SHA-256 untuk setiap file yang pernah diunduh
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, MANIFEST_NAME)
+        self.lock = threading.Lock()
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, name):
+        with self.lock:
+            return dict(self.entries.get(name, {}))
+
+    def update(self, name, **fields):
+        with self.lock:
+            self.entries.setdefault(name, {}).update(fields)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(self.entries, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def get_confirm_token(response):
+    for key, value in response.cookies.items():
+        if key.startswith('download_warning'):
+            return value
+    return None
+
+
+def _local_file_matches(path, entry):
+    if not entry.get('sha256') or not os.path.exists(path):
+        return False
+    if os.path.getsize(path) != entry.get('size'):
+        return False
+    return file_sha256(path) == entry['sha256']
+
+
+def _request(session, source, headers, timeout):
+    response = session.get(source.url, params=source.params, headers=headers,
+                           stream=True, timeout=timeout)
+    if source.gdrive:
+        token = get_confirm_token(response)
+        if token:
+            response.close()
+            params = dict(source.params, confirm=token)
+            response = session.get(source.url, params=params, headers=headers,
+                                   stream=True, timeout=timeout)
+    return response
+
+
+# Fungsi untuk mengunduh satu file. Mengembalikan status: 'fresh' (dilewati,
+# file lokal masih valid), 'downloaded', atau 'resumed'.
+def fetch_file(session, source, destination, manifest, timeout=30):
+    name = os.path.basename(destination)
+    part_path = destination + PART_SUFFIX
+    entry = manifest.get(name)
+    # Isi file sudah diketahui: file lokal yang cocok tidak perlu diminta ulang
+    if (source.expected_sha256 and os.path.exists(destination)
+            and file_sha256(destination) == source.expected_sha256):
+        return 'fresh'
+    local_ok = _local_file_matches(destination, entry)
+
+    headers = {}
+    if local_ok and entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if local_ok and entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+
+    # Lanjutkan unduhan parsial hanya jika kita tahu versi yang sama di server
+    offset = 0
+    if os.path.exists(part_path) and entry.get('partial_etag'):
+        offset = os.path.getsize(part_path)
+        if offset:
+            headers['Range'] = 'bytes=%d-' % offset
+            headers['If-Range'] = entry['partial_etag']
+
+    response = _request(session, source, headers, timeout)
+    with response:
+        if response.status_code == 304:
+            return 'fresh'
+        if response.status_code not in (200, 206):
+            raise FetchError("%s: HTTP %d" % (name, response.status_code))
+
+        etag = response.headers.get('ETag')
+        if (response.status_code == 200 and local_ok and etag
+                and etag == entry.get('etag')):
+            return 'fresh'
+
+        resumed = response.status_code == 206
+        if resumed:
+            digest = file_digest(part_path)
+            mode = 'ab'
+            total = _content_range_total(response.headers.get('Content-Range'))
+        else:
+            digest = hashlib.sha256()
+            mode = 'wb'
+            length = response.headers.get('Content-Length')
+            total = int(length) if length is not None else None
+
+        manifest.update(name, partial_etag=etag)
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+                    digest.update(chunk)
+
+    size = os.path.getsize(part_path)
+    if total is not None and size != total:
+        # Biarkan file .part tetap ada agar bisa dilanjutkan berikutnya
+        raise FetchError("%s: unduhan tidak lengkap (%d dari %d byte)" % (name, size, total))
+
+    sha256 = digest.hexdigest()
+    if source.expected_sha256 and sha256 != source.expected_sha256:
+        os.remove(part_path)
+        raise FetchError("%s: checksum SHA-256 tidak cocok" % name)
+
+    if local_ok and sha256 == entry['sha256']:
+        # Isi sama persis: jangan sentuh file lama (mtime tetap untuk cache)
+        os.remove(part_path)
+        status = 'fresh'
+    else:
+        os.replace(part_path, destination)
+        status = 'resumed' if resumed else 'downloaded'
+
+    manifest.update(name, etag=etag, last_modified=response.headers.get('Last-Modified'),
+                    size=size, sha256=sha256, partial_etag=None, url=source.url)
+    return status
+
+
+def _content_range_total(value):
+    # Format: "bytes 100-199/200"
+    if not value or '/' not in value:
+        return None
+    total = value.rsplit('/', 1)[1]
+    return int(total) if total != '*' else None
+
+
+# Fungsi untuk mengunduh beberapa file secara paralel.
+# sources: dict {nama file tujuan: Source}. Mengembalikan dict {nama: status}.
+def fetch_all(sources, directory='.', max_workers=None, session=None, timeout=30):
+    os.makedirs(directory, exist_ok=True)
+    manifest = Manifest(directory)
+    max_workers = max_workers or len(sources)
+    owns_session = session is None
+    session = session or make_session(max_workers)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                name: pool.submit(fetch_file, session, source,
+                                  os.path.join(directory, name), manifest, timeout)
+                for name, source in sources.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+    finally:
+        if owns_session:
+            session.close()
+
+
+def gdrive_sources():
+    return {name: gdrive_source(file_id, GDRIVE_SHA256.get(name))
+            for name, file_id in GDRIVE_FILES.items()}
+
+
+# ----------------------------------------------------
+# Server HTTP lokal pengganti Google Drive (mendukung ETag, 304 dan Range)
+# untuk mengukur latensi cold-start tanpa jaringan.
+# ----------------------------------------------------
+class _LocalHandler(SimpleHTTPRequestHandler):
+    latency = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = self.translate_path(self.path.split('?', 1)[0])
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        stat = os.stat(path)
+        etag = '"%x-%x"' % (stat.st_mtime_ns, stat.st_size)
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        start, end = 0, stat.st_size - 1
+        range_header = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        partial = bool(range_header and range_header.startswith('bytes=')
+                       and (if_range is None or if_range == etag))
+        if partial:
+            first, _, last = range_header[len('bytes='):].partition('-')
+            start = int(first)
+            end = int(last) if last else end
+
+        self.send_response(206 if partial else 200)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', email.utils.formatdate(stat.st_mtime, usegmt=True))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(end - start + 1))
+        if partial:
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (start, end, stat.st_size))
+        self.end_headers()
+        with open(path, 'rb') as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+
+# Fungsi untuk menjalankan server lokal di thread latar belakang.
+# Mengembalikan (server, base_url); panggil server.shutdown() setelah selesai.
+def serve_directory(directory, latency=0.0):
+    handler = type('Handler', (_LocalHandler,), {'latency': latency})
+
+    def factory(*args, **kwargs):
+        return handler(*args, directory=directory, **kwargs)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), factory)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, 'http://127.0.0.1:%d/' % server.server_address[1]
+
+
+def local_sources(base_url, names):
+    return {name: Source(base_url + name) for name in names}
+
+
+# Fungsi untuk mengukur cold start, unduhan ulang bersyarat dan resume
+# terhadap server lokal
+def benchmark(names=('day.csv', 'hour.csv'), source_dir='.', latency=0.05):
+    server, base_url = serve_directory(os.path.abspath(source_dir), latency)
+    target = tempfile.mkdtemp(prefix='fetch-bench-')
+    results = {}
+    try:
+        sources = local_sources(base_url, names)
+
+        start = time.perf_counter()
+        for name, source in sources.items():
+            fetch_all({name: source}, target, max_workers=1)
+        results['cold_serial'] = time.perf_counter() - start
+
+        shutil.rmtree(target)
+        start = time.perf_counter()
+        status = fetch_all(sources, target)
+        results['cold_concurrent'] = time.perf_counter() - start
+        results['cold_status'] = status
+
+        start = time.perf_counter()
+        results['warm_status'] = fetch_all(sources, target)
+        results['warm_conditional'] = time.perf_counter() - start
+
+        # Simulasikan unduhan terputus: setengah file tersisa sebagai .part
+        name = names[-1]
+        path = os.path.join(target, name)
+        with open(path, 'rb') as f:
+            data = f.read()
+        os.remove(path)
+        with open(path + PART_SUFFIX, 'wb') as f:
+            f.write(data[:len(data) // 2])
+        manifest = Manifest(target)
+        manifest.update(name, partial_etag=manifest.get(name)['etag'])
+        start = time.perf_counter()
+        results['resume_status'] = fetch_all({name: sources[name]}, target)
+        results['resume'] = time.perf_counter() - start
+        results['resume_ok'] = file_sha256(path) == file_sha256(os.path.join(source_dir, name))
+    finally:
+        server.shutdown()
+        shutil.rmtree(target, ignore_errors=True)
+    return results
+
+
+if __name__ == '__main__':
+    source_dir = sys.argv[1] if len(sys.argv) > 1 else '.'
+    for key, value in benchmark(source_dir=source_dir).items():
+        print("%s: %s" % (key, value))
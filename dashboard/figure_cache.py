@@ -0,0 +1,82 @@
+# ----------------------------------------------------
+# Cache gambar grafik yang sudah di-render (PNG/SVG) dengan kunci
+# (id bagian, fingerprint dataset, filter aktif, tema). Ukuran total dibatasi
+# dalam byte; entri yang paling lama tidak dipakai dibuang lebih dulu (LRU).
+# ----------------------------------------------------
+import io
+import threading
+from collections import OrderedDict
+
+FIGURE_CACHE_BYTES = 64 * 1024 * 1024
+# Sama dengan pengaturan bawaan st.pyplot
+SAVEFIG_OPTIONS = {'bbox_inches': 'tight', 'dpi': 200}
+
+
+# Fungsi untuk mengubah dict filter menjadi kunci cache yang stabil
+def filters_key(filters):
+    return tuple(sorted(
+        (name, tuple(sorted(values)) if values else None)
+        for name, values in (filters or {}).items()
+    ))
+
+
+def render_figure(fig, image_format='png'):
+    import matplotlib.pyplot as plt
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=image_format, **SAVEFIG_OPTIONS)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+class FigureCache:
+    def __init__(self, max_bytes=FIGURE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            data = self.entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        with self.lock:
+            if len(data) > self.max_bytes:
+                return
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self.entries[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    # Fungsi utama: kembalikan (byte gambar, cache hit?) dari cache, atau
+    # render lalu simpan. render: fungsi yang mengembalikan Figure matplotlib.
+    def get_or_render(self, key, render, *args, image_format='png'):
+        data = self.get(key + (image_format,))
+        if data is None:
+            data = render_figure(render(*args), image_format)
+            self.put(key + (image_format,), data)
+            return data, False
+        return data, True
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'bytes': self.size,
+                    'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,137 @@
+# ----------------------------------------------------
+# Fungsi-fungsi pembuat grafik. Setiap fungsi hanya membangun dan
+# mengembalikan Figure matplotlib (tanpa memanggil Streamlit), sehingga
+# hasilnya bisa di-cache sebagai gambar dan dipakai ulang di luar dashboard.
+# ----------------------------------------------------
+import matplotlib.pyplot as plt
+import numpy as np
+import seaborn as sns
+
+from schema import labelled
+
+
+# Visualisasi Distribusi Jumlah Total Pengguna (cnt) per Hari
+def cnt_histogram(counts, bin_edges):
+    fig = plt.figure(figsize=(12, 6))
+    widths = np.diff(bin_edges)
+
+    # Semua balok digambar dalam satu panggilan (bukan satu plt.bar per bin)
+    plt.bar(bin_edges[:-1], counts, width=widths,
+            color='lightblue', alpha=0.5, edgecolor='black', linewidth=1.5)
+
+    max_count = counts.max()
+    max_bin_index = np.argmax(counts)
+
+    plt.bar(bin_edges[max_bin_index],
+            counts[max_bin_index],
+            width=widths[max_bin_index],
+            color='darkblue', alpha=0.7, edgecolor='black', linewidth=1.5, label='Balok Tertinggi')
+
+    plt.title('Distribusi Jumlah Total Pengguna (cnt) per Hari')
+    plt.xlabel('Jumlah Total Pengguna')
+    plt.ylabel('Frekuensi')
+    plt.axvline(max_count, color='red', linestyle='--', linewidth=2, label='Jumlah Pengguna Tertinggi')
+    plt.legend()
+    plt.grid()
+    return fig
+
+
+# Distribusi variabel cuaca (suhu, kelembapan, kecepatan angin). Histogram
+# dan kurva KDE sudah dihitung oleh stats_kernel.py; di sini hanya digambar.
+def distribution(counts, bin_edges, kde_x, kde_y, color, title, xlabel):
+    fig = plt.figure(figsize=(10, 6))
+    # Tepi bin seragam: cukup jumlah bin dan rentangnya
+    ax = sns.histplot(x=bin_edges[:-1], weights=counts, bins=len(counts),
+                      binrange=(bin_edges[0], bin_edges[-1]), color=color, alpha=0.5)
+    ax.plot(kde_x, kde_y, color=color)
+    plt.title(title)
+    plt.xlabel(xlabel)
+    plt.ylabel('Frekuensi')
+    plt.grid(True)
+    return fig
+
+
+# Distribusi Kondisi Cuaca (Weathersit)
+def weather_counts(day_df):
+    fig = plt.figure(figsize=(8, 5))
+    # Label sumbu x dari kode yang benar-benar ada (data bisa sudah difilter)
+    weather = labelled(day_df['weathersit']).cat.remove_unused_categories()
+    sns.countplot(x=weather, palette='coolwarm')
+    plt.title('Distribusi Kondisi Cuaca (Weathersit)')
+    plt.xlabel('Kondisi Cuaca')
+    plt.ylabel('Frekuensi')
+    plt.grid(True)
+    return fig
+
+
+# Variasi Jumlah Penyewa Berdasarkan Musim
+def season_boxplot(day_df):
+    fig = plt.figure(figsize=(12, 6))
+    season = labelled(day_df['season']).cat.remove_unused_categories()
+    sns.boxplot(x=season, y=day_df['cnt'], palette='Blues')
+    plt.title('Variasi Jumlah Penyewa Berdasarkan Musim')
+    plt.xlabel('Musim')
+    plt.ylabel('Jumlah Penyewa')
+    plt.grid(True)
+    return fig
+
+
+# Heatmap Korelasi antara Variabel
+def correlation_heatmap(corr_matrix):
+    fig, ax = plt.subplots()
+    sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', ax=ax)
+    return fig
+
+
+# Hubungan antara Suhu dan Jumlah Pengguna Sepeda
+def temp_scatter(day_df):
+    fig, ax = plt.subplots()
+    sns.scatterplot(x='temp', y='cnt', data=day_df, ax=ax)
+    plt.title("Hubungan antara Suhu dan Jumlah Pengguna Sepeda")
+    plt.axhline(np.mean(day_df['cnt']), color='red', linestyle='--', linewidth=1.5, label='Rata-rata Pengguna')
+    plt.legend()
+    return fig
+
+
+# Perbandingan Pengguna Sepeda antara Hari Kerja dan Hari Libur
+def workingday_boxplot(workingday_data, holiday_data):
+    fig, ax = plt.subplots()
+    sns.boxplot(data=[workingday_data, holiday_data], ax=ax, palette=["lightblue", "lightcoral"])
+    plt.xticks([0, 1], ['Hari Kerja', 'Hari Libur'])
+    plt.title("Perbandingan Jumlah Pengguna Sepeda")
+    plt.axhline(np.median(workingday_data), color='blue', linestyle='--', linewidth=1.5, label='Median Hari Kerja')
+    plt.axhline(np.median(holiday_data), color='red', linestyle='--', linewidth=1.5, label='Median Hari Libur')
+    plt.legend()
+    return fig
+
+
+# Heatmap Penggunaan Sepeda Berdasarkan Hari dan Jam
+def hour_weekday_heatmap(pivot_table):
+    fig = plt.figure(figsize=(12, 6))
+    sns.heatmap(pivot_table, cmap='coolwarm', annot=True, fmt='.1f', linewidths=.5)
+    plt.title("Rata-rata Jumlah Pengguna Sepeda Berdasarkan Jam dan Hari")
+    plt.xlabel("Hari")
+    plt.ylabel("Jam")
+    return fig
+
+
+# Rata-rata Jumlah Pengguna Sepeda Berdasarkan Musim
+def season_barplot(season_avg):
+    fig = plt.figure(figsize=(10, 6))
+    sns.barplot(x='season', y='cnt', data=season_avg, palette='Blues')
+    plt.title("Rata-rata Jumlah Pengguna Sepeda Berdasarkan Musim")
+    plt.xlabel("Musim")
+    plt.ylabel("Rata-rata Jumlah Pengguna")
+    return fig
+
+
+# Perbandingan Penggunaan Sepeda pada Cuaca Ekstrem vs Rata-rata Keseluruhan
+def extreme_weather_barplot(overall_avg, extreme_weather_avg):
+    fig = plt.figure(figsize=(8, 6))
+    categories = ['Rata-rata Keseluruhan', 'Cuaca Ekstrem']
+    values = [overall_avg, extreme_weather_avg]
+
+    sns.barplot(x=categories, y=values, palette='coolwarm')
+    plt.title("Perbandingan Penggunaan Sepeda pada Cuaca Ekstrem vs Rata-rata")
+    plt.ylabel("Rata-rata Jumlah Pengguna Sepeda")
+    return fig
@@ -0,0 +1,110 @@
+# ----------------------------------------------------
+# Indeks filter berbasis bitmap. Dibangun sekali per pemuatan dataset:
+# untuk setiap nilai kategori (season, weathersit, yr, holiday, ...) disimpan
+# bitmap baris yang sudah di-pack (np.packbits, 1 bit per baris).
+# Kombinasi filter diselesaikan dengan OR (dalam satu kolom) dan AND
+# (antar kolom) langsung pada bitmap, tanpa memindai ulang DataFrame.
+#
+# Bitmap disimpan sebagai AppendArray: batch baru (IngestState) menghasilkan
+# indeks baru yang memakai bersama bitmap lama, tanpa menyalinnya.
+# ----------------------------------------------------
+import numpy as np
+
+from append_array import AppendArray
+
+FILTER_COLUMNS = ('season', 'weathersit', 'yr', 'holiday', 'workingday', 'weekday')
+
+# Pilihan "Pilih Hari" di sidebar -> nilai kolom weekday (0 = Minggu, 6 = Sabtu)
+DAY_SELECTION = {
+    'Semua': None,
+    'Weekday': (1, 2, 3, 4, 5),
+    'Weekend': (0, 6),
+}
+
+SEASON_LABELS = {1: 'Musim Dingin', 2: 'Musim Semi', 3: 'Musim Panas', 4: 'Musim Gugur'}
+WEATHER_LABELS = {1: 'Cerah', 2: 'Mendung', 3: 'Hujan', 4: 'Salju'}
+YEAR_LABELS = {0: '2011', 1: '2012'}
+WEEKDAY_LABELS = {0: 'Minggu', 1: 'Senin', 2: 'Selasa', 3: 'Rabu', 4: 'Kamis', 5: 'Jumat', 6: 'Sabtu'}
+HOLIDAY_SELECTION = {'Semua': None, 'Hari Libur': (1,), 'Bukan Hari Libur': (0,)}
+
+
+# Label tahun untuk kode yr (0 = 2011); data sintetis bisa lebih dari dua tahun
+def year_label(code):
+    return YEAR_LABELS.get(code, str(2011 + int(code)))
+
+
+# Menyambung bit baru ke bitmap yang sudah di-pack tanpa menyalin bitmap
+# lama (hanya byte terakhir yang belum penuh yang disusun ulang)
+def _append_bits(packed, rows, bits):
+    used = rows % 8
+    if not used:
+        return packed.extend(np.packbits(bits))
+    tail = np.unpackbits(packed.values[-1:], count=used).astype(bool)
+    return packed.extend(np.packbits(np.concatenate([tail, bits])), replace=1)
+
+
+class FilterIndex:
+    def __init__(self, df, columns=FILTER_COLUMNS):
+        self.rows = len(df)
+        self.columns = tuple(c for c in columns if c in df.columns)
+        self.bitmaps = {}
+        for column in self.columns:
+            values, inverse = np.unique(np.asarray(df[column]), return_inverse=True)
+            self.bitmaps[column] = {
+                value.item(): AppendArray(np.packbits(inverse == code))
+                for code, value in enumerate(values)
+            }
+
+    # Fungsi untuk membuat indeks baru yang mencakup baris tambahan df. Indeks
+    # lama tidak berubah; bitmapnya dipakai bersama dan bit baru ditulis di
+    # belakangnya, jadi biayanya sebanding dengan batch (kecuali nilai
+    # kategori baru, yang bitmapnya dibuat sepanjang seluruh data).
+    def extended(self, df):
+        result = object.__new__(FilterIndex)
+        result.rows = self.rows + len(df)
+        result.columns = self.columns
+        result.bitmaps = {}
+        for column in self.columns:
+            values = np.asarray(df[column])
+            bitmaps = dict(self.bitmaps[column])
+            for value in np.unique(values):
+                if value.item() not in bitmaps:
+                    bitmaps[value.item()] = AppendArray(np.packbits(np.zeros(self.rows, dtype=bool)))
+            result.bitmaps[column] = {value: _append_bits(packed, self.rows, values == value)
+                                      for value, packed in bitmaps.items()}
+        return result
+
+    def values(self, column):
+        return sorted(self.bitmaps.get(column, {}))
+
+    # Fungsi untuk menggabungkan filter menjadi satu bitmap.
+    # filters: {kolom: daftar nilai}; None atau daftar kosong berarti "semua".
+    # Bit di belakang baris terakhir tidak berarti (bisa milik versi indeks
+    # yang lebih baru), jadi hasilnya selalu dibongkar dengan count=self.rows.
+    def select(self, filters):
+        result = None
+        for column, wanted in filters.items():
+            if not wanted or column not in self.bitmaps:
+                continue
+            bitmaps = self.bitmaps[column]
+            column_mask = np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+            for value in wanted:
+                if value in bitmaps:
+                    column_mask |= bitmaps[value].values
+            result = column_mask if result is None else result & column_mask
+        if result is None:
+            result = np.packbits(np.ones(self.rows, dtype=bool))
+        return result
+
+    def row_ids(self, filters):
+        return np.flatnonzero(np.unpackbits(self.select(filters), count=self.rows))
+
+    # Fungsi untuk mengambil baris yang lolos filter. Jika tidak ada filter
+    # aktif, DataFrame asli dikembalikan apa adanya (tanpa salinan).
+    def apply(self, df, filters):
+        if not any(filters.values()):
+            return df
+        row_ids = self.row_ids(filters)
+        if len(row_ids) == self.rows:
+            return df
+        return df.take(row_ids)
@@ -0,0 +1,350 @@
+# ----------------------------------------------------
+# Mode ingest inkremental. Baris baru day/hour ditambahkan lewat
+# IngestState.append(), dan semua statistik diperbarui dari state berjalan
+# yang bisa digabung (mergeable):
+# - statistik cukup (XᵀX, Xᵀy, yᵀy) untuk regresi cuaca,
+# - mean dan matriks ko-momen untuk matriks korelasi,
+# - rollup cube dan indeks filter,
+# - histogram nilai (value counts) untuk cnt.
+# Statistik diperbarui dari batch baru saja (tanpa menghitung ulang atau
+# menyalin histori); setiap append menghasilkan Snapshot baru yang tidak bisa
+# diubah, jadi pembaca tidak pernah melihat indeks atau cube yang setengah
+# diperbarui.
+#
+# Pemeriksaan regresi terhadap sklearn (dari folder dashboard):
+#   python incremental.py [day.csv]
+# ----------------------------------------------------
+import copy
+import threading
+
+import numpy as np
+import pandas as pd
+
+from filter_index import FilterIndex
+from rollup import RollupCube
+from time_index import TimeIndex, timestamps
+
+REGRESSION_FEATURES = ('weathersit', 'temp', 'hum', 'windspeed')
+REGRESSION_TARGET = 'cnt'
+CORRELATION_COLUMNS = ('cnt', 'weathersit', 'temp', 'hum', 'windspeed')
+
+
+class RunningRegression:
+    # Regresi linear (dengan intercept) dari persamaan normal yang bisa diakumulasi
+
+    def __init__(self, features=REGRESSION_FEATURES, target=REGRESSION_TARGET):
+        self.features = tuple(features)
+        self.target = target
+        k = len(self.features) + 1
+        self.n = 0
+        self.xtx = np.zeros((k, k))
+        self.xty = np.zeros(k)
+        self.yty = 0.0
+        self.y_sum = 0.0
+
+    def _design(self, df):
+        X = np.asarray(df[list(self.features)], dtype=np.float64)
+        return np.column_stack([np.ones(len(X)), X])
+
+    def update(self, df):
+        X = self._design(df)
+        y = np.asarray(df[self.target], dtype=np.float64)
+        self.n += len(y)
+        self.xtx += X.T @ X
+        self.xty += X.T @ y
+        self.yty += y @ y
+        self.y_sum += y.sum()
+        return self
+
+    def merge(self, other):
+        self.n += other.n
+        self.xtx += other.xtx
+        self.xty += other.xty
+        self.yty += other.yty
+        self.y_sum += other.y_sum
+        return self
+
+    # Statistik cukup terpusat: Sxx = XᵀX - n·x̄x̄ᵀ, Sxy = Xᵀy - n·x̄ȳ, Syy
+    def _centered(self):
+        x_mean = self.xtx[0, 1:] / self.n
+        y_mean = self.y_sum / self.n
+        sxx = self.xtx[1:, 1:] - self.n * np.outer(x_mean, x_mean)
+        sxy = self.xty[1:] - self.n * x_mean * y_mean
+        syy = self.yty - self.n * y_mean ** 2
+        return x_mean, y_mean, sxx, sxy, syy
+
+    # Koefisien [intercept, b1, ..., bk]. Diselesaikan pada fitur terpusat
+    # (seperti LinearRegression): fitur yang konstan karena filter mendapat
+    # koefisien 0 dan intercept = ȳ - x̄ᵀβ, bukan intercept yang terbagi.
+    def solve(self):
+        if not self.n:
+            return np.full(len(self.features) + 1, np.nan)
+        x_mean, y_mean, sxx, sxy, _ = self._centered()
+        beta = np.linalg.lstsq(sxx, sxy, rcond=None)[0]
+        return np.r_[y_mean - x_mean @ beta, beta]
+
+    def coefficients(self):
+        return pd.DataFrame(self.solve()[1:], self.features, columns=['Coefficient'])
+
+    def predict(self, X):
+        beta = self.solve()
+        return beta[0] + np.asarray(X, dtype=np.float64) @ beta[1:]
+
+    # Jumlah kuadrat galat dihitung langsung dari statistik cukup terpusat
+    def sse(self):
+        if not self.n:
+            return np.nan
+        _, _, sxx, sxy, syy = self._centered()
+        beta = self.solve()[1:]
+        return max(syy - 2 * beta @ sxy + beta @ sxx @ beta, 0.0)
+
+    def mse(self):
+        return self.sse() / self.n if self.n else np.nan
+
+    def r2(self):
+        sst = self._centered()[4] if self.n else 0.0
+        return 1 - self.sse() / sst if sst > 0 else np.nan
+
+
+class RunningMoments:
+    # Mean dan matriks ko-momen (algoritma paralel Chan) untuk korelasi/kovarians
+
+    def __init__(self, columns=CORRELATION_COLUMNS):
+        self.columns = tuple(columns)
+        k = len(self.columns)
+        self.n = 0
+        self.mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+
+    def update(self, df):
+        X = np.asarray(df[list(self.columns)], dtype=np.float64)
+        if not len(X):
+            return self
+        other = RunningMoments(self.columns)
+        other.n = len(X)
+        other.mean = X.mean(axis=0)
+        centered = X - other.mean
+        other.comoment = centered.T @ centered
+        return self.merge(other)
+
+    def merge(self, other):
+        if not other.n:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment = (self.comoment + other.comoment
+                         + np.outer(delta, delta) * self.n * other.n / n)
+        self.mean = self.mean + delta * other.n / n
+        self.n = n
+        return self
+
+    def corr(self):
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = self.comoment / np.outer(std, std)
+        return pd.DataFrame(corr, self.columns, self.columns)
+
+
+class ValueCounts:
+    # Histogram streaming untuk kolom bilangan bulat: menyimpan frekuensi
+    # setiap nilai sehingga histogram dengan bin berapa pun bisa dibentuk
+    # ulang tepat sama dengan np.histogram atas data mentah.
+
+    def __init__(self):
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.int64)
+        if not len(values):
+            return self
+        low, high = values.min(), values.max()
+        self._grow(low, high)
+        self.counts += np.bincount(values - self.offset, minlength=len(self.counts))
+        return self
+
+    def _grow(self, low, high):
+        if not len(self.counts):
+            self.offset = low
+            self.counts = np.zeros(high - low + 1, dtype=np.int64)
+            return
+        before = max(0, self.offset - low)
+        after = max(0, high - (self.offset + len(self.counts) - 1))
+        if before or after:
+            self.counts = np.pad(self.counts, (before, after))
+            self.offset -= before
+
+    def merge(self, other):
+        if len(other.counts):
+            self._grow(other.offset, other.offset + len(other.counts) - 1)
+            start = other.offset - self.offset
+            self.counts[start:start + len(other.counts)] += other.counts
+        return self
+
+    @property
+    def n(self):
+        return int(self.counts.sum())
+
+    def values(self):
+        present = np.flatnonzero(self.counts)
+        return present + self.offset, self.counts[present]
+
+    def histogram(self, bins=30):
+        values, counts = self.values()
+        hist, edges = np.histogram(values, bins=bins, weights=counts)
+        return hist.astype(np.int64), edges
+
+
+def _concat(parts):
+    return parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+
+
+class Snapshot:
+    # Satu versi data lengkap: potongan frame, indeks filter, rollup cube,
+    # statistik berjalan dan indeks waktu. Tidak pernah diubah setelah dibuat,
+    # sehingga satu rerun yang memakai satu snapshot selalu melihat data yang
+    # konsisten. Potongan frame dan buffer indeks dipakai bersama dengan
+    # snapshot sebelumnya.
+
+    def __init__(self, fingerprint, version, day_parts, hour_parts, day_index, hour_index, day_cube,
+                 hour_cube, regression, moments, day_cnt, day_time, hour_time):
+        self.data_version = fingerprint + (version,)
+        self.day_parts = day_parts
+        self.hour_parts = hour_parts
+        self.day_index = day_index
+        self.hour_index = hour_index
+        self.day_cube = day_cube
+        self.hour_cube = hour_cube
+        self.regression = regression
+        self.moments = moments
+        self.day_cnt = day_cnt
+        self.day_time = day_time
+        self.hour_time = hour_time
+        self._frames = None
+
+    # Frame lengkap; potongan digabung saat pertama kali dibaca (sekali per
+    # snapshot), bukan saat append
+    def frames(self):
+        if self._frames is None:
+            self._frames = (_concat(self.day_parts), _concat(self.hour_parts))
+        return self._frames
+
+    def time_indexes(self):
+        return self.day_time, self.hour_time
+
+
+class IngestState:
+    # State berjalan untuk satu dataset day/hour yang dipakai bersama oleh
+    # banyak sesi. Pembaca mengambil snapshot() sekali per rerun; append()
+    # menyusun snapshot baru (penulis diserialkan oleh lock) lalu menggantinya
+    # dalam satu penugasan, tanpa mengubah snapshot lama di tempat.
+
+    def __init__(self, day_df, hour_df):
+        self.lock = threading.Lock()
+        self.fingerprint = (day_df.attrs.get('fingerprint'), hour_df.attrs.get('fingerprint'))
+        self._snapshot = Snapshot(
+            self.fingerprint, 0, (day_df,), (hour_df,), FilterIndex(day_df), FilterIndex(hour_df),
+            RollupCube(day_df), RollupCube(hour_df), RunningRegression().update(day_df),
+            RunningMoments().update(day_df), ValueCounts().update(day_df['cnt']),
+            TimeIndex(day_df), TimeIndex(hour_df))
+
+    def snapshot(self):
+        return self._snapshot
+
+    @property
+    def data_version(self):
+        return self._snapshot.data_version
+
+    # Fungsi untuk menambahkan batch baris baru day dan/atau hour. Baris yang
+    # kuncinya (dteday, hr, city) sudah ada di data atau muncul dua kali di
+    # batch dilewati, sehingga batch yang sama tidak terhitung dua kali.
+    # Histori tidak disalin: frame lama dipakai bersama sebagai potongan,
+    # indeks filter dan indeks waktu disambung dengan batch, dan hanya state
+    # berukuran tetap (statistik regresi/momen, value counts, cube) yang
+    # disalin. Mengembalikan jumlah baris (day, hour) yang benar-benar ditambahkan.
+    def append(self, day_rows=None, hour_rows=None):
+        with self.lock:
+            old = self._snapshot
+            day_rows = self._new_rows(day_rows, old.day_parts[0], old.day_time)
+            hour_rows = self._new_rows(hour_rows, old.hour_parts[0], old.hour_time)
+            if not len(day_rows) and not len(hour_rows):
+                return 0, 0
+
+            day_parts, day_index, day_cube = old.day_parts, old.day_index, old.day_cube
+            regression, moments, day_cnt, day_time = old.regression, old.moments, old.day_cnt, old.day_time
+            if len(day_rows):
+                day_parts = old.day_parts + (day_rows,)
+                day_index = old.day_index.extended(day_rows)
+                day_cube = copy.deepcopy(old.day_cube)
+                day_cube.update(day_rows)
+                regression = copy.deepcopy(old.regression).update(day_rows)
+                moments = copy.deepcopy(old.moments).update(day_rows)
+                day_cnt = copy.deepcopy(old.day_cnt).update(day_rows['cnt'])
+                day_time = old.day_time.extended(day_rows)
+
+            hour_parts, hour_index, hour_cube, hour_time = old.hour_parts, old.hour_index, old.hour_cube, old.hour_time
+            if len(hour_rows):
+                hour_parts = old.hour_parts + (hour_rows,)
+                hour_index = old.hour_index.extended(hour_rows)
+                hour_cube = copy.deepcopy(old.hour_cube)
+                hour_cube.update(hour_rows)
+                hour_time = old.hour_time.extended(hour_rows)
+
+            self._snapshot = Snapshot(
+                self.fingerprint, old.data_version[-1] + 1, day_parts, hour_parts, day_index, hour_index,
+                day_cube, hour_cube, regression, moments, day_cnt, day_time, hour_time)
+            return len(day_rows), len(hour_rows)
+
+    @staticmethod
+    def _conform(rows, template):
+        missing = [c for c in template.columns if c not in rows.columns]
+        if missing:
+            raise ValueError("Kolom tidak ditemukan di data baru: %s" % ', '.join(missing))
+        return rows[list(template.columns)].astype(template.dtypes.to_dict())
+
+    # Baris batch yang belum ada: keanggotaan diperiksa lewat binary search di
+    # indeks waktu (timestamp, lalu kota bila ada), biayanya sebanding dengan batch
+    @classmethod
+    def _new_rows(cls, rows, template, time_index):
+        if rows is None or not len(rows):
+            return template.iloc[:0]
+        rows = cls._conform(rows, template)
+        cities = np.asarray(rows['city']) if 'city' in rows.columns else None
+        repeated = rows[[c for c in ('city', 'dteday', 'hr') if c in rows.columns]].duplicated().to_numpy()
+        fresh = ~time_index.contains(timestamps(rows), cities) & ~repeated
+        return rows[fresh].reset_index(drop=True)
+
+
+# Fungsi untuk membandingkan RunningRegression dengan LinearRegression pada
+# data penuh dan subset hasil filter (termasuk filter yang membuat satu fitur
+# konstan, mis. weathersit=[1]). Mengembalikan DataFrame per subset.
+def check_regression(day_df, features=REGRESSION_FEATURES, target=REGRESSION_TARGET):
+    from sklearn.linear_model import LinearRegression
+
+    subsets = {'semua': day_df}
+    for column in ('weathersit', 'season', 'workingday'):
+        for code in np.unique(day_df[column]):
+            subsets['%s=%d' % (column, code)] = day_df[day_df[column] == code]
+
+    rows = []
+    for name, subset in subsets.items():
+        if len(subset) <= len(features):
+            continue
+        model = RunningRegression(features, target).update(subset)
+        reference = LinearRegression().fit(np.asarray(subset[list(features)], dtype=np.float64),
+                                           np.asarray(subset[target], dtype=np.float64))
+        expected = np.r_[reference.intercept_, reference.coef_]
+        error = np.abs(model.solve() - expected).max() / max(np.abs(expected).max(), 1.0)
+        rows.append({'subset': name, 'rows': len(subset), 'max_rel_error': error,
+                     'ok': bool(error < 1e-6)})
+    return pd.DataFrame(rows)
+
+
+if __name__ == '__main__':
+    import sys
+
+    from dataset_store import load_frame
+
+    result = check_regression(load_frame(sys.argv[1] if len(sys.argv) > 1 else 'day.csv', table='day'))
+    print(result.to_string(index=False))
+    print("%d/%d subset cocok dengan LinearRegression" % (int(result['ok'].sum()), len(result)))
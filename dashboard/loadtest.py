@@ -0,0 +1,123 @@
+# ----------------------------------------------------
+# Uji beban lokal untuk api.py. Beberapa thread klien (masing-masing satu
+# koneksi keep-alive) mengirim permintaan ke setiap endpoint selama durasi
+# tertentu, lalu latensi p50/p99 dan throughput (permintaan/detik) dicatat
+# per endpoint. Tanpa --url, server dijalankan di proses ini pada port bebas.
+#
+# Cara pakai (dari folder dashboard):
+#   python loadtest.py [--url http://127.0.0.1:8502] [--duration 5] [--concurrency 8]
+#                      [--batch 1000] [--ttl 60] [--json hasil.json]
+# ----------------------------------------------------
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+
+# Permintaan yang diuji: (nama, metode, path, body)
+def scenarios(batch, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = {
+        'weathersit': rng.integers(1, 4, batch).tolist(),
+        'temp': rng.uniform(0, 1, batch).round(4).tolist(),
+        'hum': rng.uniform(0, 1, batch).round(4).tolist(),
+        'windspeed': rng.uniform(0, 0.6, batch).round(4).tolist(),
+    }
+    return [
+        ('season_averages', 'GET', '/season-averages', None),
+        ('season_averages_filtered', 'GET', '/season-averages?weathersit=1,2&yr=1', None),
+        ('hour_weekday_pivot', 'GET', '/hour-weekday-pivot', None),
+        ('correlation', 'GET', '/correlation', None),
+        ('correlation_filtered', 'GET', '/correlation?season=3', None),
+        ('predict_batch_%d' % batch, 'POST', '/predict', json.dumps(rows).encode()),
+    ]
+
+
+def _client(host, port, method, path, body, deadline, latencies, errors):
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    headers = {'Content-Type': 'application/json'} if body else {}
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - start)
+            if response.status != 200:
+                errors.append(response.status)
+    finally:
+        connection.close()
+
+
+# Fungsi untuk menjalankan satu skenario dengan N klien bersamaan
+def run_scenario(host, port, method, path, body, duration, concurrency):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    threads = [threading.Thread(target=_client, args=(host, port, method, path, body, deadline,
+                                                      latencies, errors))
+               for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    seconds = np.asarray(latencies)
+    return {
+        'requests': len(seconds),
+        'errors': len(errors),
+        'throughput_rps': len(seconds) / elapsed,
+        'p50_ms': float(np.percentile(seconds, 50) * 1e3) if len(seconds) else None,
+        'p99_ms': float(np.percentile(seconds, 99) * 1e3) if len(seconds) else None,
+        'max_ms': float(seconds.max() * 1e3) if len(seconds) else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Uji beban layanan JSON dashboard')
+    parser.add_argument('--url', default=None, help='server yang sudah berjalan')
+    parser.add_argument('--directory', default='.', help='folder data untuk server lokal')
+    parser.add_argument('--ttl', type=float, default=60, help='TTL cache server lokal (0 = tanpa cache)')
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--batch', type=int, default=1000, help='jumlah baris per permintaan prediksi')
+    parser.add_argument('--json', default=None)
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        from api import DashboardService, make_server
+        server = make_server(DashboardService(args.directory, args.ttl), port=0)
+        host, port = server.server_address[:2]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    results = {}
+    try:
+        print("%-28s %9s %7s %10s %9s %9s" % ('endpoint', 'req', 'error', 'req/detik', 'p50 ms', 'p99 ms'))
+        for name, method, path, body in scenarios(args.batch):
+            result = run_scenario(host, port, method, path, body, args.duration, args.concurrency)
+            results[name] = dict(result, method=method, path=path)
+            print("%-28s %9d %7d %10.1f %9.2f %9.2f" % (
+                name, result['requests'], result['errors'], result['throughput_rps'],
+                result['p50_ms'] or 0, result['p99_ms'] or 0))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'concurrency': args.concurrency, 'duration': args.duration,
+                       'batch': args.batch, 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+# ----------------------------------------------------
+# Instrumentasi per bagian dashboard. Setiap bagian logis (pemuatan data,
+# state ingest, filter, dan setiap bagian di sections.py) dibungkus dengan
+# SectionProfiler.section(), yang mencatat per rerun:
+# - waktu wall dan waktu CPU thread sesi,
+# - puncak memori yang dialokasikan selama bagian berjalan (tracemalloc,
+#   hanya bila proses dijalankan dengan PYTHONTRACEMALLOC=1),
+# - hit/miss cache gambar dan miss cache data (st.cache_data),
+# - waktu render grafik (matplotlib -> PNG) dan waktu kirim gambar (st.image).
+# Catatan bisa ditampilkan di panel sidebar dan diekspor sebagai JSON lines
+# atau file teks Prometheus (untuk textfile collector / scraper lokal).
+#
+# tracemalloc bersifat global per proses (memperlambat semua alokasi dan
+# reset_peak() berlaku untuk semua thread), jadi profiler tidak pernah
+# menyalakannya sendiri: pelacakan memori hanya aktif bila dinyalakan sejak
+# startup lewat PYTHONTRACEMALLOC=1. Bila beberapa sesi berjalan bersamaan,
+# puncak memori satu bagian bisa ikut menghitung alokasi sesi lain.
+# ----------------------------------------------------
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+PROFILE_ENV = 'DASHBOARD_PROFILE'
+JSONL_ENV = 'DASHBOARD_PROFILE_JSONL'
+PROMETHEUS_ENV = 'DASHBOARD_PROFILE_PROM'
+METRIC_PREFIX = 'dashboard_section'
+
+_local = threading.local()
+
+
+# Profiler aktif di thread ini (satu per rerun sesi Streamlit)
+def current():
+    return getattr(_local, 'profiler', None)
+
+
+# Fungsi untuk memulai profiling satu rerun; None jika profiling nonaktif
+def start(enabled, memory=True, session=None):
+    _local.profiler = None
+    if enabled:
+        _local.profiler = SectionProfiler(memory, session)
+    return _local.profiler
+
+
+# Bungkus satu bagian logis; tanpa biaya apa pun saat profiling nonaktif
+def section(name):
+    profiler = current()
+    return profiler.section(name) if profiler is not None else nullcontext()
+
+
+# Dipanggil dari dalam fungsi ber-@st.cache_data: badan fungsi hanya
+# dieksekusi ketika cache miss
+def cache_miss():
+    profiler = current()
+    if profiler is not None:
+        profiler.add('data_cache_misses', 1)
+
+
+# Dipanggil di tempat gambar diambil dari cache grafik. Penghitung milik
+# FigureCache berlaku untuk semua sesi, jadi hit/miss dicatat per profiler.
+def figure_cache_result(hit):
+    profiler = current()
+    if profiler is not None:
+        profiler.add('figure_cache_hits' if hit else 'figure_cache_misses', 1)
+
+
+# Menambahkan durasi blok ke field catatan bagian yang sedang berjalan,
+# mis. waktu render grafik atau waktu kirim gambar ke browser
+@contextmanager
+def timer(field):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler = current()
+        if profiler is not None:
+            profiler.add(field, time.perf_counter() - start)
+
+
+class SectionProfiler:
+    def __init__(self, memory=True, session=None):
+        self.memory = memory and tracemalloc.is_tracing()
+        self.session = session
+        self.rerun = time.time()
+        self.records = []
+        self._active = []
+
+    def add(self, field, value):
+        if self._active:
+            record = self._active[-1]
+            record[field] = record.get(field, 0) + value
+
+    @contextmanager
+    def section(self, name):
+        record = {'session': self.session, 'rerun': self.rerun, 'section': name,
+                  'data_cache_misses': 0, 'figure_cache_hits': 0, 'figure_cache_misses': 0,
+                  'render_seconds': 0.0, 'image_seconds': 0.0}
+        self._active.append(record)
+        if self.memory:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        cpu = time.thread_time()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] = time.perf_counter() - start
+            record['cpu_seconds'] = time.thread_time() - cpu
+            if self.memory:
+                record['peak_bytes'] = max(tracemalloc.get_traced_memory()[1] - base, 0)
+            self._active.pop()
+            self.records.append(record)
+
+
+class MetricsRegistry:
+    # Agregat lintas sesi dan rerun untuk ekspor Prometheus
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sections = {}
+
+    def observe(self, records):
+        with self.lock:
+            for record in records:
+                totals = self.sections.setdefault(record['section'], {
+                    'runs': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0,
+                    'render_seconds': 0.0, 'image_seconds': 0.0,
+                    'figure_cache_hits': 0, 'figure_cache_misses': 0, 'data_cache_misses': 0,
+                    'last_wall_seconds': 0.0, 'last_peak_bytes': 0,
+                })
+                totals['runs'] += 1
+                for field in ('wall_seconds', 'cpu_seconds', 'render_seconds', 'image_seconds',
+                              'figure_cache_hits', 'figure_cache_misses', 'data_cache_misses'):
+                    totals[field] += record.get(field, 0)
+                totals['last_wall_seconds'] = record['wall_seconds']
+                totals['last_peak_bytes'] = record.get('peak_bytes', 0)
+
+    def prometheus_text(self):
+        metrics = (
+            ('runs_total', 'runs', 'counter', 'Jumlah eksekusi bagian'),
+            ('wall_seconds_total', 'wall_seconds', 'counter', 'Total waktu wall per bagian'),
+            ('cpu_seconds_total', 'cpu_seconds', 'counter', 'Total waktu CPU per bagian'),
+            ('render_seconds_total', 'render_seconds', 'counter', 'Total waktu render grafik'),
+            ('image_seconds_total', 'image_seconds', 'counter', 'Total waktu kirim gambar'),
+            ('figure_cache_hits_total', 'figure_cache_hits', 'counter', 'Hit cache gambar'),
+            ('figure_cache_misses_total', 'figure_cache_misses', 'counter', 'Miss cache gambar'),
+            ('data_cache_misses_total', 'data_cache_misses', 'counter', 'Miss st.cache_data'),
+            ('last_wall_seconds', 'last_wall_seconds', 'gauge', 'Waktu wall eksekusi terakhir'),
+            ('last_peak_bytes', 'last_peak_bytes', 'gauge', 'Puncak memori eksekusi terakhir'),
+        )
+        with self.lock:
+            lines = []
+            for suffix, field, kind, help_text in metrics:
+                name = '%s_%s' % (METRIC_PREFIX, suffix)
+                lines.append('# HELP %s %s' % (name, help_text))
+                lines.append('# TYPE %s %s' % (name, kind))
+                for section_name, totals in sorted(self.sections.items()):
+                    lines.append('%s{section="%s"} %s' % (name, section_name, repr(float(totals[field]))))
+            return '\n'.join(lines) + '\n'
+
+
+def to_jsonl(records):
+    return ''.join(json.dumps(record) + '\n' for record in records)
+
+
+# Fungsi untuk menambahkan catatan ke file JSON lines
+def write_jsonl(path, records):
+    with open(path, 'a') as f:
+        f.write(to_jsonl(records))
+
+
+# Fungsi untuk menulis file teks Prometheus secara atomik (textfile collector
+# tidak boleh membaca file yang setengah ditulis)
+def write_prometheus(path, registry):
+    # Nama file sementara unik per penulis: beberapa sesi bisa mengekspor bersamaan
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp',
+                                    dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(registry.prometheus_text())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# Fungsi untuk mengekspor hasil satu rerun ke tujuan yang dikonfigurasi lewat
+# environment variable
+def export(profiler, registry):
+    registry.observe(profiler.records)
+    if os.environ.get(JSONL_ENV):
+        write_jsonl(os.environ[JSONL_ENV], profiler.records)
+    if os.environ.get(PROMETHEUS_ENV):
+        write_prometheus(os.environ[PROMETHEUS_ENV], registry)
+
+
+def enabled_by_env():
+    return os.environ.get(PROFILE_ENV, '') not in ('', '0') or bool(
+        os.environ.get(JSONL_ENV) or os.environ.get(PROMETHEUS_ENV))
@@ -0,0 +1,238 @@
+# ----------------------------------------------------
+# Generator laporan statis tanpa browser. Bagian-bagian di sections.py
+# dijalankan apa adanya, tetapi tampilannya ditulis ke ReportPage (bukan
+# Streamlit) dan setiap grafik di-render di process pool dengan backend Agg.
+# Grafik dari semua dataset dikirim ke pool sekaligus, sehingga waktu
+# pembuatan banyak laporan berskala dengan jumlah core. Hasilnya satu file
+# HTML (gambar tertanam base64) per dataset, ditambah timings.json berisi
+# waktu per laporan dan per bagian.
+#
+# Cara pakai (dari folder dashboard; setiap folder berisi day.csv dan hour.csv):
+#   python report.py [folder ...] [--output-dir laporan] [--workers N] [--resamples 2000]
+# ----------------------------------------------------
+import argparse
+import base64
+import html
+import json
+import multiprocessing
+import os
+import re
+import textwrap
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import pandas as pd
+
+import profiling
+from dataset_store import load_frame
+from incremental import IngestState
+from sections import SECTIONS, SectionContext, run_section
+
+REPORT_STYLE = """
+body { font-family: sans-serif; max-width: 960px; margin: 2em auto; line-height: 1.5; color: #222; }
+img { max-width: 100%; }
+table { border-collapse: collapse; font-size: 0.9em; margin: 1em 0; }
+th, td { border: 1px solid #ccc; padding: 0.2em 0.6em; text-align: right; }
+code { background: #f3f3f3; padding: 0 0.2em; }
+"""
+
+
+# Dijalankan di worker: bangun grafik lalu simpan sebagai gambar
+def _render_worker(render, args, image_format):
+    import matplotlib
+    matplotlib.use('Agg')
+    from figure_cache import render_figure
+
+    start = time.perf_counter()
+    data = render_figure(render(*args), image_format)
+    return data, time.perf_counter() - start
+
+
+class FigureRenderer:
+    # Pengganti FigureCache untuk laporan: setiap grafik dikirim ke pool dan
+    # yang dikembalikan adalah Future (diselesaikan saat HTML ditulis)
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.submitted = 0
+
+    def get_or_render(self, key, render, *args, image_format='png'):
+        self.submitted += 1
+        return self.pool.submit(_render_worker, render, args, image_format), False
+
+
+def _inline_markdown(text):
+    text = html.escape(text)
+    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    return re.sub(r'`(.+?)`', r'<code>\1</code>', text)
+
+
+# Konversi markdown sederhana (judul ###, daftar, paragraf, tebal, kode)
+# yang cukup untuk teks penjelasan di sections.py
+def markdown_to_html(text):
+    parts, paragraph, items, list_tag = [], [], [], None
+
+    def flush():
+        nonlocal paragraph, items, list_tag
+        if paragraph:
+            parts.append('<p>%s</p>' % _inline_markdown(' '.join(paragraph)))
+        if items:
+            parts.append('<%s>%s</%s>' % (list_tag, ''.join(
+                '<li>%s</li>' % _inline_markdown(item) for item in items), list_tag))
+        paragraph, items, list_tag = [], [], None
+
+    for line in textwrap.dedent(text).strip().splitlines():
+        line = line.strip()
+        heading = re.match(r'(#{1,6})\s+(.*)', line)
+        bullet = re.match(r'[-*]\s+(.*)', line)
+        numbered = re.match(r'\d+\.\s+(.*)', line)
+        if not line:
+            flush()
+        elif heading:
+            flush()
+            level = min(len(heading.group(1)) + 1, 6)
+            parts.append('<h%d>%s</h%d>' % (level, _inline_markdown(heading.group(2)), level))
+        elif bullet or numbered:
+            tag = 'ul' if bullet else 'ol'
+            if paragraph or (list_tag and list_tag != tag):
+                flush()
+            list_tag = tag
+            items.append((bullet or numbered).group(1))
+        else:
+            paragraph.append(line)
+    flush()
+    return '\n'.join(parts)
+
+
+class ReportPage:
+    # Meniru subset API Streamlit yang dipakai sections.py
+
+    def __init__(self, resamples=None):
+        self.resamples = resamples
+        self.blocks = []
+
+    def header(self, text):
+        self.blocks.append(('html', '<h2>%s</h2>' % _inline_markdown(text)))
+
+    def subheader(self, text):
+        self.blocks.append(('html', '<h3>%s</h3>' % _inline_markdown(text)))
+
+    def markdown(self, text):
+        self.blocks.append(('html', markdown_to_html(text)))
+
+    def write(self, *args):
+        for arg in args:
+            if isinstance(arg, (pd.DataFrame, pd.Series)):
+                self.dataframe(arg)
+            else:
+                self.blocks.append(('html', '<p>%s</p>' % _inline_markdown(str(arg))))
+
+    def dataframe(self, data):
+        if isinstance(data, pd.Series):
+            data = data.to_frame()
+        self.blocks.append(('html', data.to_html(border=0)))
+
+    def image(self, image, **kwargs):
+        self.blocks.append(('image', image))
+
+    def select_slider(self, label, options, value=None, key=None):
+        return self.resamples or value
+
+    # Laporan selalu memakai rentang bawaan (seluruh data)
+    def slider(self, label, min_value=None, max_value=None, value=None, **kwargs):
+        return value
+
+    # Menyusun HTML; menunggu grafik yang masih di-render di worker
+    def to_html(self, title):
+        body, render_seconds = [], 0.0
+        for kind, content in self.blocks:
+            if kind == 'image':
+                if isinstance(content, Future):
+                    content, seconds = content.result()
+                    render_seconds += seconds
+                body.append('<img src="data:image/png;base64,%s">' % base64.b64encode(content).decode())
+            else:
+                body.append(content)
+        document = ('<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>%s</title>'
+                    '<style>%s</style></head><body>\n<h1>%s</h1>\n%s\n</body></html>\n') % (
+            html.escape(title), REPORT_STYLE, html.escape(title), '\n'.join(body))
+        return document, render_seconds
+
+
+# Fungsi untuk menjalankan semua bagian untuk satu dataset. Grafik belum
+# selesai saat fungsi ini kembali (masih berjalan di pool).
+def build_report(directory, pool, resamples=None):
+    start = time.perf_counter()
+    day_df = load_frame(os.path.join(directory, 'day.csv'), table='day')
+    hour_df = load_frame(os.path.join(directory, 'hour.csv'), table='hour')
+    state = IngestState(day_df, hour_df).snapshot()
+    load_seconds = time.perf_counter() - start
+
+    page = ReportPage(resamples)
+    renderer = FigureRenderer(pool)
+    filters = {'weekday': None, 'season': [], 'weathersit': [], 'yr': [], 'holiday': None}
+    ctx = SectionContext(state, day_df, hour_df, filters, renderer, 'light', page)
+    profiler = profiling.start(True, memory=False, session=os.path.basename(directory))
+    for key in SECTIONS:
+        run_section(key, ctx)
+    profiling.start(False)
+
+    return {
+        'start': start,
+        'page': page,
+        'timings': {
+            'dataset': os.path.abspath(directory),
+            'day_rows': len(day_df),
+            'hour_rows': len(hour_df),
+            'load_seconds': load_seconds,
+            'compute_seconds': time.perf_counter() - start - load_seconds,
+            'figures': renderer.submitted,
+            'sections': profiler.records,
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Laporan HTML statis per dataset')
+    parser.add_argument('datasets', nargs='*', default=['.'])
+    parser.add_argument('--output-dir', default='laporan')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--resamples', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    start = time.perf_counter()
+    pool = ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context('spawn'))
+    try:
+        # Tahap 1: hitung semua bagian; grafik dari semua dataset mengantre di pool
+        reports = [build_report(directory, pool, args.resamples) for directory in args.datasets]
+
+        # Tahap 2: tunggu grafik dan tulis HTML per dataset
+        timings = []
+        for directory, report in zip(args.datasets, reports):
+            name = os.path.basename(os.path.abspath(directory))
+            document, render_seconds = report['page'].to_html("Bike Sharing Dataset: %s" % name)
+            path = os.path.join(args.output_dir, '%s.html' % name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(document)
+            report['timings'].update({
+                'report': path,
+                'html_bytes': len(document.encode('utf-8')),
+                'render_seconds': render_seconds,
+                'report_seconds': time.perf_counter() - report['start'],
+            })
+            timings.append(report['timings'])
+            print("%-24s %6d hari %8d jam  %3d grafik  %6.2fs" % (
+                name, report['timings']['day_rows'], report['timings']['hour_rows'],
+                report['timings']['figures'], report['timings']['report_seconds']))
+    finally:
+        pool.shutdown()
+
+    summary = {'workers': args.workers, 'wall_seconds': time.perf_counter() - start, 'reports': timings}
+    with open(os.path.join(args.output_dir, 'timings.json'), 'w') as f:
+        json.dump(summary, f, indent=2)
+    print("total %.2fs dengan %d worker" % (summary['wall_seconds'], args.workers))
+
+
+if __name__ == '__main__':
+    main()
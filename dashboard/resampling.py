@@ -0,0 +1,172 @@
+# ----------------------------------------------------
+# Mesin uji signifikansi berbasis resampling. Uji permutasi dan bootstrap
+# dijalankan dalam batch: setiap batch membangkitkan matriks resample NumPy
+# (satu baris = satu resample) sehingga statistiknya dihitung secara
+# vektor. Batch dibagi ke process pool dengan seed deterministik
+# (SeedSequence.spawn per batch), sehingga hasil tidak bergantung pada
+# jumlah worker.
+# ----------------------------------------------------
+import itertools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from filter_index import SEASON_LABELS, WEATHER_LABELS
+from incremental import REGRESSION_FEATURES, REGRESSION_TARGET, RunningRegression
+
+BATCH_SIZE = 500
+# Batas elemen matriks resample per batch agar memori worker tetap terkendali
+MAX_BATCH_ELEMENTS = 4_000_000
+DEFAULT_RESAMPLES = 2000
+CONFIDENCE = 0.95
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+# Process pool dipakai ulang antar-permintaan agar biaya start worker
+# hanya dibayar sekali. 'spawn' dipakai karena aman di dalam server
+# Streamlit yang multi-thread.
+def get_pool(workers):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers,
+                                        mp_context=multiprocessing.get_context('spawn'))
+            _pool_workers = workers
+        return _pool
+
+
+# ----------------------------------------------------
+# Batch resample (dijalankan di worker)
+# ----------------------------------------------------
+def _permutation_batch(a, b, size, seed):
+    rng = np.random.default_rng(seed)
+    pooled = np.concatenate([a, b])
+    perms = rng.permuted(np.tile(pooled, (size, 1)), axis=1)
+    sum_a = perms[:, :len(a)].sum(axis=1)
+    return sum_a / len(a) - (pooled.sum() - sum_a) / len(b)
+
+
+def _bootstrap_batch(a, b, size, seed):
+    rng = np.random.default_rng(seed)
+    mean_a = a[rng.integers(0, len(a), (size, len(a)))].mean(axis=1)
+    mean_b = b[rng.integers(0, len(b), (size, len(b)))].mean(axis=1)
+    return mean_a - mean_b
+
+
+# Setiap resample diselesaikan pada fitur terpusat (seperti LinearRegression
+# dan RunningRegression.solve): intercept = ȳ - x̄ᵀβ
+def _regression_batch(X, y, size, seed):
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, len(y), (size, len(y)))
+    Xb, yb = X[rows], y[rows]
+    x_mean, y_mean = Xb.mean(axis=1), yb.mean(axis=1)
+    Xc, yc = Xb - x_mean[:, None, :], yb - y_mean[:, None]
+    sxx = np.einsum('bni,bnj->bij', Xc, Xc)
+    sxy = np.einsum('bni,bn->bi', Xc, yc)
+    try:
+        beta = np.linalg.solve(sxx, sxy[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        # Fitur konstan (mis. karena filter): solusi norma minimum, koefisien 0
+        beta = np.einsum('bij,bj->bi', np.linalg.pinv(sxx), sxy)
+    intercept = y_mean - np.einsum('bi,bi->b', x_mean, beta)
+    return np.column_stack([intercept, beta])
+
+
+def _run_batches(tasks, seed, workers):
+    # tasks: daftar (fungsi, argumen, jumlah resample, elemen per resample).
+    # Setiap tugas dipecah menjadi batch dengan seed turunan masing-masing.
+    jobs = []
+    for task_id, (fn, args, n_resamples, width) in enumerate(tasks):
+        batch_size = max(1, min(BATCH_SIZE, MAX_BATCH_ELEMENTS // max(width, 1)))
+        sizes = [batch_size] * (n_resamples // batch_size)
+        if n_resamples % batch_size:
+            sizes.append(n_resamples % batch_size)
+        seeds = np.random.SeedSequence([seed, task_id]).spawn(len(sizes))
+        jobs.extend((task_id, fn, args, size, s) for size, s in zip(sizes, seeds))
+
+    workers = workers or min(4, os.cpu_count() or 1)
+    if workers == 1:
+        results = [fn(*args, size, s) for _, fn, args, size, s in jobs]
+    else:
+        pool = get_pool(workers)
+        futures = [pool.submit(fn, *args, size, s) for _, fn, args, size, s in jobs]
+        results = [future.result() for future in futures]
+
+    merged = [[] for _ in tasks]
+    for (task_id, *_), result in zip(jobs, results):
+        merged[task_id].append(result)
+    return [np.concatenate(parts) for parts in merged]
+
+
+# ----------------------------------------------------
+# API publik
+# ----------------------------------------------------
+# Pasangan kelompok yang diuji: semua pasangan musim, semua pasangan kondisi
+# cuaca, dan hari kerja vs hari libur
+def group_pairs(day_df, target='cnt'):
+    pairs = []
+    for column, labels in (('season', SEASON_LABELS), ('weathersit', WEATHER_LABELS)):
+        groups = {v: np.asarray(g[target], dtype=np.float64) for v, g in day_df.groupby(column)}
+        for x, y in itertools.combinations(sorted(groups), 2):
+            pairs.append((column, labels.get(x, x), labels.get(y, y), groups[x], groups[y]))
+    workingday = np.asarray(day_df.loc[day_df['workingday'] == 1, target], dtype=np.float64)
+    holiday = np.asarray(day_df.loc[day_df['holiday'] == 1, target], dtype=np.float64)
+    pairs.append(('workingday/holiday', 'Hari Kerja', 'Hari Libur', workingday, holiday))
+    return [p for p in pairs if len(p[3]) > 1 and len(p[4]) > 1]
+
+
+# Fungsi untuk menjalankan uji permutasi (p-value dua sisi untuk selisih
+# rata-rata) dan interval kepercayaan bootstrap untuk setiap pasangan kelompok
+def pairwise_tests(day_df, n_resamples=DEFAULT_RESAMPLES, seed=42, workers=None):
+    pairs = group_pairs(day_df)
+    tasks = []
+    for _, _, _, a, b in pairs:
+        tasks.append((_permutation_batch, (a, b), n_resamples, len(a) + len(b)))
+        tasks.append((_bootstrap_batch, (a, b), n_resamples, len(a) + len(b)))
+    results = _run_batches(tasks, seed, workers)
+
+    alpha = (1 - CONFIDENCE) / 2
+    rows = []
+    for i, (column, label_a, label_b, a, b) in enumerate(pairs):
+        permuted, boot = results[2 * i], results[2 * i + 1]
+        observed = a.mean() - b.mean()
+        extreme = np.count_nonzero(np.abs(permuted) >= abs(observed) - 1e-9)
+        rows.append({
+            'Faktor': column,
+            'Kelompok A': label_a,
+            'Kelompok B': label_b,
+            'n A': len(a),
+            'n B': len(b),
+            'Selisih Rata-rata': observed,
+            'p-value Permutasi': (extreme + 1) / (len(permuted) + 1),
+            'CI Bawah': np.quantile(boot, alpha),
+            'CI Atas': np.quantile(boot, 1 - alpha),
+        })
+    return pd.DataFrame(rows)
+
+
+# Fungsi untuk menghitung interval kepercayaan bootstrap koefisien regresi
+def regression_bootstrap(day_df, n_resamples=DEFAULT_RESAMPLES, seed=42, workers=None,
+                         features=REGRESSION_FEATURES, target=REGRESSION_TARGET):
+    X = np.asarray(day_df[list(features)], dtype=np.float64)
+    y = np.asarray(day_df[target], dtype=np.float64)
+    (coefs,) = _run_batches([(_regression_batch, (X, y), n_resamples, X.size)], seed, workers)
+
+    alpha = (1 - CONFIDENCE) / 2
+    estimate = RunningRegression(features, target).update(day_df).solve()
+    names = ['intercept'] + list(features)
+    return pd.DataFrame({
+        'Coefficient': estimate,
+        'Std Error': coefs.std(axis=0, ddof=1),
+        'CI Bawah': np.quantile(coefs, alpha, axis=0),
+        'CI Atas': np.quantile(coefs, 1 - alpha, axis=0),
+    }, index=names)
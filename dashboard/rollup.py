@@ -0,0 +1,163 @@
+# ----------------------------------------------------
+# Rollup cube: jumlah (sum) dan banyaknya baris (count) untuk setiap
+# kombinasi dimensi kategori. Dibangun sekali per pemuatan dataset, lalu
+# rata-rata, total dan pivot untuk dimensi-dimensi ini dijawab dari cube
+# (O(sel)) tanpa menyentuh baris mentah (O(baris)).
+# ----------------------------------------------------
+import numpy as np
+import pandas as pd
+
+CUBE_DIMENSIONS = ('hr', 'weekday', 'season', 'weathersit', 'workingday', 'holiday', 'yr', 'mnth')
+CUBE_MEASURES = ('cnt', 'casual', 'registered')
+
+
+class RollupCube:
+    def __init__(self, df, dimensions=CUBE_DIMENSIONS, measures=CUBE_MEASURES):
+        self.dimensions = tuple(d for d in dimensions if d in df.columns)
+        self.measures = tuple(m for m in measures if m in df.columns)
+
+        self.levels = {}
+        for dim in self.dimensions:
+            values = np.asarray(df[dim], dtype=np.int64)
+            low, high = (values.min(), values.max()) if len(values) else (0, 0)
+            self.levels[dim] = np.arange(low, high + 1)
+        shape = tuple(len(self.levels[d]) for d in self.dimensions)
+
+        self.counts = np.zeros(shape, dtype=np.int64)
+        self.sums = {m: np.zeros(shape) for m in self.measures}
+        self._accumulate(df)
+
+    # Fungsi untuk menambahkan baris baru ke cube; biayanya sebanding dengan
+    # jumlah baris baru (cube hanya diperbesar jika muncul nilai kategori baru)
+    def update(self, df):
+        self._grow(df)
+        self._accumulate(df)
+
+    def _grow(self, df):
+        bounds = {}
+        for dim in self.dimensions:
+            values = np.asarray(df[dim], dtype=np.int64)
+            if len(values):
+                bounds[dim] = (values.min(), values.max())
+        self._extend(bounds)
+
+    # Memperbesar cube agar mencakup rentang nilai {dimensi: (min, max)}
+    def _extend(self, bounds):
+        padding = []
+        for dim in self.dimensions:
+            levels = self.levels[dim]
+            low, high = bounds.get(dim, (levels[0], levels[-1]))
+            before = max(0, levels[0] - low)
+            after = max(0, high - levels[-1])
+            padding.append((before, after))
+            self.levels[dim] = np.arange(levels[0] - before, levels[-1] + after + 1)
+        if any(before or after for before, after in padding):
+            self.counts = np.pad(self.counts, padding)
+            self.sums = {m: np.pad(values, padding) for m, values in self.sums.items()}
+
+    # Fungsi untuk menggabungkan cube lain (mis. hasil parsial satu chunk)
+    def merge(self, other):
+        if not other.counts.any():
+            return self
+        if not self.counts.any():
+            self.levels = dict(other.levels)
+            self.counts = other.counts.copy()
+            self.sums = {m: values.copy() for m, values in other.sums.items()}
+            return self
+        self._extend({d: (other.levels[d][0], other.levels[d][-1]) for d in self.dimensions})
+        region = tuple(slice(other.levels[d][0] - self.levels[d][0],
+                             other.levels[d][-1] - self.levels[d][0] + 1) for d in self.dimensions)
+        self.counts[region] += other.counts
+        for m in self.measures:
+            self.sums[m][region] += other.sums[m]
+        return self
+
+    def _accumulate(self, df):
+        if not len(df):
+            return
+        codes = [np.asarray(df[d], dtype=np.int64) - self.levels[d][0] for d in self.dimensions]
+        shape = self.counts.shape
+        linear = np.ravel_multi_index(codes, shape) if codes else np.zeros(len(df), dtype=np.int64)
+
+        # bincount untuk batch besar, np.add.at agar batch kecil tetap O(batch)
+        if len(linear) >= self.counts.size:
+            self.counts += np.bincount(linear, minlength=self.counts.size).reshape(shape)
+            for m in self.measures:
+                weights = np.asarray(df[m], dtype=np.float64)
+                self.sums[m] += np.bincount(linear, weights=weights, minlength=self.counts.size).reshape(shape)
+        else:
+            np.add.at(self.counts.reshape(-1), linear, 1)
+            for m in self.measures:
+                np.add.at(self.sums[m].reshape(-1), linear, np.asarray(df[m], dtype=np.float64))
+
+    @property
+    def cells(self):
+        return self.counts.size
+
+    # Memotong cube sesuai filter {dimensi: daftar nilai}; kosong/None = semua
+    def _restrict(self, array, where):
+        for dim, wanted in (where or {}).items():
+            if not wanted or dim not in self.dimensions:
+                continue
+            levels = self.levels[dim]
+            positions = [int(v) - levels[0] for v in wanted if levels[0] <= int(v) <= levels[-1]]
+            positions = np.array(sorted(set(positions)), dtype=np.intp)
+            array = np.take(array, positions, axis=self.dimensions.index(dim))
+        return array
+
+    def _reduce(self, array, by, where):
+        array = self._restrict(array, where)
+        keep = [self.dimensions.index(d) for d in by]
+        other = tuple(i for i in range(array.ndim) if i not in keep)
+        array = array.sum(axis=other)
+        # Urutkan sumbu sesuai urutan `by`
+        order = np.argsort(np.argsort(keep)) if keep else []
+        return np.transpose(array, order) if len(keep) > 1 else array
+
+    def _levels(self, by, where):
+        result = []
+        for dim in by:
+            levels = self.levels[dim]
+            wanted = (where or {}).get(dim)
+            if wanted:
+                levels = np.array(sorted({int(v) for v in wanted if levels[0] <= int(v) <= levels[-1]}),
+                                  dtype=np.int64)
+            result.append(levels)
+        return result
+
+    def count(self, by=(), where=None):
+        return self._reduce(self.counts, by, where)
+
+    def total(self, measure, by=(), where=None):
+        return self._reduce(self.sums[measure], by, where)
+
+    def mean(self, measure, by=(), where=None):
+        counts = self.count(by, where)
+        totals = self.total(measure, by, where)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result = np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+        # Tanpa dimensi `by` hasilnya skalar biasa
+        return result.item() if result.ndim == 0 else result
+
+    # Fungsi untuk menghasilkan Series (1 dimensi) atau pivot DataFrame
+    # (2 dimensi: baris = by[0], kolom = by[1]) seperti groupby/pivot_table.
+    # Kombinasi tanpa data dibuang, sama seperti pandas.
+    def frame(self, measure, by, where=None, aggfunc='mean'):
+        if aggfunc == 'mean':
+            values = self.mean(measure, by, where)
+        elif aggfunc == 'sum':
+            values = np.where(self.count(by, where) > 0, self.total(measure, by, where), np.nan)
+        elif aggfunc == 'count':
+            values = np.where(self.count(by, where) > 0, self.count(by, where), np.nan)
+        else:
+            raise ValueError("aggfunc tidak didukung: %s" % aggfunc)
+
+        levels = self._levels(by, where)
+        if len(by) == 1:
+            series = pd.Series(values, index=pd.Index(levels[0], name=by[0]), name=measure)
+            return series.dropna()
+        if len(by) == 2:
+            pivot = pd.DataFrame(values, index=pd.Index(levels[0], name=by[0]),
+                                 columns=pd.Index(levels[1], name=by[1]))
+            return pivot.dropna(how='all').dropna(axis=1, how='all')
+        raise ValueError("frame() hanya mendukung 1 atau 2 dimensi")
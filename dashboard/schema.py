@@ -0,0 +1,238 @@
+# ----------------------------------------------------
+# Skema kolom untuk day.csv dan hour.csv. Setiap kolom punya tipe ringkas
+# (uint8 untuk kode kategori, int16/int32 untuk jumlah, float32 untuk cuaca
+# ternormalisasi, datetime untuk dteday) dan rentang nilai yang valid.
+# Skema diterapkan sekali saat pemuatan (sebelum cache kolom biner ditulis),
+# lengkap dengan validasi vektor: rentang, nilai hilang, casual + registered
+# == cnt, dan konsistensi workingday dengan weekday/holiday.
+#
+# Kolom kode (season, weathersit, weekday, ...) tetap disimpan sebagai angka
+# karena rollup cube, indeks bitmap dan regresi bekerja dengan kode; label
+# Indonesia tersedia sebagai Categorical lewat labelled().
+#
+# Cara pakai (dari folder dashboard):  python schema.py [day.csv hour.csv]
+# (membandingkan memori/waktu, lalu memeriksa bahwa data rusak ditolak)
+# ----------------------------------------------------
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from filter_index import SEASON_LABELS, WEATHER_LABELS, WEEKDAY_LABELS, YEAR_LABELS
+
+SCHEMA_VERSION = 1
+
+# kolom: (dtype, nilai minimum, nilai maksimum); None = batas dtype
+_COMMON = {
+    'instant': ('uint32', 1, None),
+    'dteday': ('datetime64[ns]', None, None),
+    'season': ('uint8', 1, 4),
+    'yr': ('uint8', 0, None),
+    'mnth': ('uint8', 1, 12),
+    'holiday': ('uint8', 0, 1),
+    'weekday': ('uint8', 0, 6),
+    'workingday': ('uint8', 0, 1),
+    'weathersit': ('uint8', 1, 4),
+    'temp': ('float32', 0, 1),
+    'atemp': ('float32', 0, 1),
+    'hum': ('float32', 0, 1),
+    'windspeed': ('float32', 0, 1),
+}
+DAY_SCHEMA = dict(_COMMON, casual=('int32', 0, None), registered=('int32', 0, None),
+                  cnt=('int32', 0, None))
+HOUR_SCHEMA = dict(_COMMON, hr=('uint8', 0, 23), casual=('int16', 0, None),
+                   registered=('int16', 0, None), cnt=('int16', 0, None))
+SCHEMAS = {'day': DAY_SCHEMA, 'hour': HOUR_SCHEMA}
+
+# Label yang dipakai di grafik untuk kolom kode
+LABELS = {
+    'season': SEASON_LABELS,
+    'weathersit': WEATHER_LABELS,
+    'weekday': WEEKDAY_LABELS,
+    'yr': YEAR_LABELS,
+    'holiday': {0: 'Bukan Hari Libur', 1: 'Hari Libur'},
+    'workingday': {0: 'Hari Libur', 1: 'Hari Kerja'},
+}
+
+
+class SchemaError(ValueError):
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__('; '.join(problems))
+
+
+def schema_id(table):
+    return '%s-v%d' % (table, SCHEMA_VERSION)
+
+
+# Fungsi untuk memeriksa frame mentah terhadap skema. Mengembalikan daftar
+# masalah (kosong jika valid); semua pemeriksaan berupa operasi vektor.
+def validate(df, table):
+    schema = SCHEMAS[table]
+    problems = []
+    missing = [c for c in schema if c not in df.columns]
+    if missing:
+        problems.append("kolom tidak ditemukan: %s" % ', '.join(missing))
+
+    present = [c for c in schema if c in df.columns]
+    nulls = df[present].isnull().sum()
+    for column, count in nulls[nulls > 0].items():
+        problems.append("%s: %d nilai hilang" % (column, count))
+
+    # Nilai numerik hasil konversi (sel bukan angka menjadi NaN), dipakai
+    # juga oleh pemeriksaan antar kolom agar tidak gagal pada kolom teks
+    numeric = {}
+    for column in present:
+        dtype, low, high = schema[column]
+        if dtype.startswith('datetime'):
+            parsed = pd.to_datetime(df[column], errors='coerce')
+            invalid = int(parsed.isna().sum() - df[column].isna().sum())
+            if invalid:
+                problems.append("%s: %d tanggal tidak valid" % (column, invalid))
+            continue
+        values = pd.to_numeric(df[column], errors='coerce')
+        numeric[column] = values
+        not_numbers = int((values.isna() & df[column].notna()).sum())
+        if not_numbers:
+            problems.append("%s: %d nilai bukan angka" % (column, not_numbers))
+        if np.dtype(dtype).kind in 'iu':
+            info = np.iinfo(dtype)
+            low = info.min if low is None else low
+            high = info.max if high is None else high
+            fractional = int((values.notna() & (values != values.round())).sum())
+            if fractional:
+                problems.append("%s: %d nilai bukan bilangan bulat" % (column, fractional))
+        outside = 0
+        if low is not None:
+            outside += int((values < low).sum())
+        if high is not None:
+            outside += int((values > high).sum())
+        if outside:
+            problems.append("%s: %d nilai di luar rentang [%s, %s]" % (column, outside, low, high))
+
+    if not missing:
+        # Hanya baris yang semua nilainya terbaca; sel kosong/bukan angka
+        # sudah dilaporkan di atas
+        casual, registered, cnt = numeric['casual'], numeric['registered'], numeric['cnt']
+        known = casual.notna() & registered.notna() & cnt.notna()
+        mismatch = int((known & (casual + registered != cnt)).sum())
+        if mismatch:
+            problems.append("casual + registered != cnt pada %d baris" % mismatch)
+        weekday, holiday, workingday = numeric['weekday'], numeric['holiday'], numeric['workingday']
+        known = weekday.notna() & holiday.notna() & workingday.notna()
+        expected = weekday.between(1, 5) & (holiday == 0)
+        inconsistent = int((known & (workingday != expected.astype(int))).sum())
+        if inconsistent:
+            problems.append("workingday tidak konsisten dengan weekday/holiday pada %d baris" % inconsistent)
+    return problems
+
+
+# Fungsi untuk memvalidasi lalu mengubah frame ke tipe ringkas sesuai skema.
+# Kolom di luar skema (mis. city) dibiarkan apa adanya.
+def apply(df, table):
+    problems = validate(df, table)
+    if problems:
+        raise SchemaError(problems)
+
+    data = {}
+    for column in df.columns:
+        if column not in SCHEMAS[table]:
+            data[column] = df[column]
+            continue
+        dtype = SCHEMAS[table][column][0]
+        if dtype.startswith('datetime'):
+            data[column] = pd.to_datetime(df[column])
+        else:
+            data[column] = df[column].to_numpy().astype(dtype)
+    frame = pd.DataFrame(data, copy=False)
+    frame.attrs.update(df.attrs)
+    return frame
+
+
+# Label Indonesia sebagai Categorical (urutan sesuai kode) tanpa mengubah
+# kolom kode di frame
+def labelled(series):
+    labels = LABELS[series.name]
+    codes = np.searchsorted(np.array(list(labels)), np.asarray(series))
+    categories = pd.CategoricalDtype(list(labels.values()), ordered=True)
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=categories), index=series.index,
+                     name=series.name)
+
+
+# Fungsi untuk membandingkan memori dan waktu groupby/pivot antara tipe
+# bawaan pandas dan tipe ringkas dari skema
+def compare(csv_path, table, repeat=5):
+    raw = pd.read_csv(csv_path)
+    compact = apply(raw, table)
+
+    def best_of(fn, df):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(df)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    operations = {
+        'groupby': lambda df: (df.groupby('season')['cnt'].mean(),
+                               df.groupby(['workingday', 'weathersit'])['cnt'].agg(['mean', 'sum'])),
+        'pivot': lambda df: df.pivot_table(index='mnth', columns='weekday', values='cnt', aggfunc='mean'),
+    }
+    if 'hr' in raw.columns:
+        operations['pivot'] = lambda df: df.pivot_table(index='hr', columns='weekday', values='cnt',
+                                                        aggfunc='mean')
+    result = {
+        'file': csv_path,
+        'raw_bytes': int(raw.memory_usage(deep=True).sum()),
+        'compact_bytes': int(compact.memory_usage(deep=True).sum()),
+    }
+    for name, fn in operations.items():
+        result[name + '_raw_seconds'] = best_of(fn, raw)
+        result[name + '_compact_seconds'] = best_of(fn, compact)
+    return result
+
+
+# Fungsi untuk memeriksa bahwa data rusak ditolak dengan SchemaError (bukan
+# TypeError dari operasi kolom). Mengembalikan {kasus: lolos?}.
+def check_invalid(csv_path, table):
+    raw = pd.read_csv(csv_path, nrows=50)
+    cases = {}
+    for column in ('cnt', 'weekday', 'temp'):
+        broken = raw.astype({column: object})
+        broken.loc[3, column] = 'x'
+        cases['teks di %s' % column] = broken
+    broken = raw.copy()
+    broken.loc[3, 'dteday'] = 'bukan tanggal'
+    cases['tanggal tidak valid'] = broken
+    broken = raw.copy()
+    broken.loc[3, 'cnt'] += 1
+    cases['casual + registered != cnt'] = broken
+    broken = raw.astype({'casual': object})
+    broken.loc[3, 'casual'] = ''
+    cases['sel kosong'] = broken
+
+    results = {}
+    for name, df in cases.items():
+        try:
+            apply(df, table)
+            results[name] = False
+        except SchemaError:
+            results[name] = True
+    results['data asli diterima'] = len(apply(raw, table)) == len(raw)
+    return results
+
+
+if __name__ == '__main__':
+    paths = sys.argv[1:] or ['day.csv', 'hour.csv']
+    for path in paths:
+        table = 'hour' if 'hour' in path else 'day'
+        result = compare(path, table)
+        print("%s: memori %.2f MB -> %.2f MB (%.1fx lebih kecil)" % (
+            path, result['raw_bytes'] / 2 ** 20, result['compact_bytes'] / 2 ** 20,
+            result['raw_bytes'] / result['compact_bytes']))
+        for name in ('groupby', 'pivot'):
+            raw_time, compact_time = result[name + '_raw_seconds'], result[name + '_compact_seconds']
+            print("  %-8s %.4fs -> %.4fs (%.2fx)" % (name, raw_time, compact_time, raw_time / compact_time))
+        for name, ok in check_invalid(path, table).items():
+            print("  %-28s %s" % (name, 'lolos' if ok else 'GAGAL'))
@@ -0,0 +1,494 @@
+# ----------------------------------------------------
+# Bagian-bagian dashboard yang didaftarkan secara terpisah. Setiap bagian
+# hanya dihitung dan di-render ketika dipilih, dan library berat (sklearn,
+# scipy, matplotlib/seaborn) hanya diimpor oleh bagian yang membutuhkannya.
+# ----------------------------------------------------
+from collections import namedtuple
+
+import numpy as np
+import streamlit as st
+
+import profiling
+from figure_cache import filters_key
+from filter_index import SEASON_LABELS, WEEKDAY_LABELS
+from incremental import CORRELATION_COLUMNS, RunningRegression
+
+Section = namedtuple('Section', ['key', 'title', 'render'])
+
+# Daftar bagian sesuai urutan tampilan di dashboard
+SECTIONS = {}
+
+
+def section(key, title):
+    def register(render):
+        SECTIONS[key] = Section(key, title, render)
+        return render
+    return register
+
+
+# Data dan layanan yang dibutuhkan oleh setiap bagian. `state` adalah satu
+# Snapshot dari IngestState yang dipakai untuk seluruh rerun. `page` adalah tujuan
+# tampilan: modul streamlit, atau penulis laporan statis (report.py) dengan
+# metode yang sama (header, markdown, write, image, ...).
+class SectionContext:
+    def __init__(self, state, day_df, hour_df, filters, figure_cache, theme, page=st):
+        self.st = page
+        self.state = state
+        self.day_df = day_df
+        self.hour_df = hour_df
+        self.day_cube = state.day_cube
+        self.hour_cube = state.hour_cube
+        self.filters = filters
+        self.filtered = any(filters.values())
+        self.data_version = state.data_version
+        self.filter_key = filters_key(filters)
+        self.figure_cache = figure_cache
+        self.figure_key = (self.data_version, self.filter_key, theme)
+
+    # Fungsi untuk menampilkan grafik dari cache; grafik hanya di-render ulang
+    # jika dataset, filter atau tema berubah
+    def show_figure(self, section_id, render, *args):
+        key = (section_id,) + self.figure_key
+        with profiling.timer('render_seconds'):
+            image, hit = self.figure_cache.get_or_render(key, render, *args)
+        profiling.figure_cache_result(hit)
+        with profiling.timer('image_seconds'):
+            self.st.image(image, use_column_width=True)
+
+    # Statistik di bawah ini diambil dari snapshot state berjalan bila
+    # tidak ada filter aktif; jika ada filter, dihitung dari baris terpilih.
+    def cnt_histogram(self, bins=30):
+        if not self.filtered:
+            return self.state.day_cnt.histogram(bins)
+        return np.histogram(self.day_df['cnt'], bins=bins)
+
+    def correlation(self):
+        if not self.filtered:
+            return self.state.moments.corr()
+        columns = list(CORRELATION_COLUMNS)
+        return self.column_stats('day').corr.loc[columns, columns]
+
+    def regression(self):
+        if not self.filtered:
+            return self.state.regression
+        return RunningRegression().update(self.day_df)
+
+    # Statistik semua kolom numerik (stats_kernel.py) untuk baris terpilih,
+    # dihitung sekali per versi data dan filter
+    def column_stats(self, table):
+        df = self.day_df if table == 'day' else self.hour_df
+        return cached_column_stats(self.data_version, self.filter_key, table, df)
+
+
+# Hasil uji resampling di-cache per versi data dan filter
+@st.cache_data(show_spinner="Menjalankan uji permutasi dan bootstrap...")
+def cached_pairwise_tests(data_version, filter_key, n_resamples, _day_df):
+    from resampling import pairwise_tests
+    profiling.cache_miss()
+    return pairwise_tests(_day_df, n_resamples)
+
+
+@st.cache_data(show_spinner="Menghitung bootstrap koefisien regresi...")
+def cached_regression_bootstrap(data_version, filter_key, n_resamples, _day_df):
+    from resampling import regression_bootstrap
+    profiling.cache_miss()
+    return regression_bootstrap(_day_df, n_resamples)
+
+
+@st.cache_data(show_spinner=False)
+def cached_column_stats(data_version, filter_key, table, _df):
+    from stats_kernel import column_stats
+    profiling.cache_miss()
+    return column_stats(_df)
+
+
+def resample_count(ctx, key):
+    return ctx.st.select_slider("Jumlah resample", [1000, 2000, 5000, 10000], value=2000, key=key)
+
+
+def run_section(key, ctx):
+    with profiling.section(key):
+        SECTIONS[key].render(ctx)
+
+
+@section('data_wrangling', "Data Wrangling")
+def data_wrangling(ctx):
+    st = ctx.st
+    day_df, hour_df = ctx.day_df, ctx.hour_df
+
+    # Menampilkan data wrangling (tampilan beberapa baris pertama)
+    st.header("Data Wrangling")
+    st.subheader("Beberapa Baris Pertama dari Dataset 'day.csv'")
+    st.write(day_df.head())
+
+    st.subheader("Beberapa Baris Pertama dari Dataset 'hour.csv'")
+    st.write(hour_df.head())
+
+    # Mengecek nilai yang hilang dalam dataset
+    st.subheader("Jumlah Nilai yang Hilang di Dataset 'day.csv'")
+    missing_day = ctx.column_stats('day').missing_counts(day_df)
+    st.write(missing_day)
+
+    st.subheader("Jumlah Nilai yang Hilang di Dataset 'hour.csv'")
+    missing_hour = ctx.column_stats('hour').missing_counts(hour_df)
+    st.write(missing_hour)
+
+
+# ----------------------------------------------------
+# Visualisasi Distribusi Jumlah Total Pengguna (cnt) dalam dataset 'day.csv'
+# ----------------------------------------------------
+@section('distribusi', "Distribusi Data")
+def distribusi(ctx):
+    import figures
+
+    st = ctx.st
+    day_df = ctx.day_df
+    stats = ctx.column_stats('day')
+
+    st.header("Visualisasi Distribusi Jumlah Total Pengguna (cnt) per Hari")
+    ctx.show_figure('cnt_histogram', figures.cnt_histogram, *ctx.cnt_histogram())
+
+    # ----------------------------------------------------
+    # Visualisasi Sebelum Pertanyaan: Variabel Cuaca dan Kondisi
+    # (histogram dan KDE dari kernel statistik, bukan KDE ulang per grafik)
+    # ----------------------------------------------------
+
+    # Distribusi Suhu
+    st.header("Distribusi Suhu (Temperature)")
+    ctx.show_figure('temp_distribution', figures.distribution,
+                    *stats.histogram('temp'), *stats.kde('temp', scale='count'), 'orange',
+                    "Distribusi Suhu (Temperature)", 'Suhu (Normalisasi)')
+
+    # Distribusi Kelembapan
+    st.header("Distribusi Kelembapan (Humidity)")
+    ctx.show_figure('hum_distribution', figures.distribution,
+                    *stats.histogram('hum'), *stats.kde('hum', scale='count'), 'green',
+                    "Distribusi Kelembapan (Humidity)", 'Kelembapan')
+
+    # Distribusi Kecepatan Angin
+    st.header("Distribusi Kecepatan Angin (Windspeed)")
+    ctx.show_figure('windspeed_distribution', figures.distribution,
+                    *stats.histogram('windspeed'), *stats.kde('windspeed', scale='count'), 'blue',
+                    "Distribusi Kecepatan Angin (Windspeed)", 'Kecepatan Angin (Normalisasi)')
+
+    # Distribusi Kondisi Cuaca
+    st.header("Distribusi Kondisi Cuaca (Weathersit)")
+    ctx.show_figure('weather_counts', figures.weather_counts, day_df)
+
+    # ----------------------------------------------------
+    # Visualisasi Variasi Jumlah Penyewa Berdasarkan Musim
+    # ----------------------------------------------------
+    st.header("Variasi Jumlah Penyewa Berdasarkan Musim")
+    ctx.show_figure('season_boxplot', figures.season_boxplot, day_df)
+
+
+# ----------------------------------------------------
+# Pertanyaan 1: Faktor cuaca dan waktu mana yang paling signifikan mempengaruhi jumlah penyewaan sepeda?
+# ----------------------------------------------------
+@section('pertanyaan_1', "Pertanyaan 1: Faktor Cuaca dan Waktu")
+def pertanyaan_1(ctx):
+    import figures
+
+    st = ctx.st
+    day_df = ctx.day_df
+
+    st.header("Pertanyaan 1: Faktor cuaca dan waktu mana yang paling signifikan mempengaruhi jumlah penyewaan sepeda?")
+    st.markdown("""
+    ### Langkah-langkah:
+    1. Data Wrangling: Memastikan tidak ada missing values dalam data yang dianalisis.
+    2. Analisis Korelasi: Menilai hubungan antara cuaca (weathersit), suhu (temp), kelembaban (hum), dan kecepatan angin (windspeed) dengan jumlah pengguna sepeda (cnt).
+    3. Analisis Regresi Linear: Menentukan faktor mana yang paling signifikan mempengaruhi jumlah pengguna sepeda dalam sehari.
+    4. Visualisasi: Menampilkan visualisasi hubungan antar variabel.
+    """)
+
+    # 1. Korelasi antar variabel
+    st.subheader("Heatmap Korelasi antara Variabel")
+    st.markdown("""
+    **Penjelasan Visualisasi:** Heatmap ini menunjukkan korelasi antar variabel dalam dataset. Warna yang lebih gelap menunjukkan korelasi positif yang lebih kuat, sedangkan warna yang lebih terang menunjukkan korelasi negatif atau korelasi yang lebih lemah. Ini membantu kita memahami variabel mana yang memiliki pengaruh signifikan terhadap jumlah pengguna sepeda (`cnt`).
+    """)
+    ctx.show_figure('correlation_heatmap', figures.correlation_heatmap, ctx.correlation())
+
+    st.markdown("""
+    **Jawaban:** Dari heatmap korelasi, terlihat bahwa suhu (`temp`) memiliki korelasi positif paling kuat dengan jumlah penyewa sepeda (`cnt`). Artinya, semakin tinggi suhu, semakin banyak pengguna sepeda. Di sisi lain, kelembaban (`hum`) dan kecepatan angin (`windspeed`) memiliki korelasi negatif, yang menunjukkan bahwa kondisi cuaca ini cenderung menurunkan jumlah penyewa sepeda. 
+
+    Visualisasi ini mendukung bahwa suhu adalah salah satu faktor yang paling mempengaruhi jumlah penyewaan.
+    """)
+
+    # 2. Regresi Linear Sederhana
+    st.subheader("Analisis Regresi Linear untuk Menentukan Faktor yang Paling Mempengaruhi")
+    st.markdown("""
+    **Penjelasan Hasil:** Koefisien dari model regresi linear menunjukkan seberapa besar pengaruh setiap variabel terhadap jumlah pengguna sepeda. Variabel dengan koefisien tertinggi adalah yang paling signifikan mempengaruhi jumlah pengguna. Nilai R-Squared menunjukkan seberapa baik model ini menjelaskan variasi data.
+    """)
+    # Model regresi linear dari statistik cukup (XᵀX, Xᵀy) yang diperbarui
+    # setiap kali data baru masuk, sehingga tidak perlu fit ulang dari nol
+    model = ctx.regression()
+
+    # Menampilkan koefisien
+    st.write(model.coefficients())
+
+    # Menampilkan hasil model regresi
+    st.write(f"R-Squared: {model.r2()}")
+    st.write(f"Mean Squared Error: {model.mse()}")
+
+    # Interval kepercayaan bootstrap untuk koefisien regresi
+    st.markdown("""
+    **Interval Kepercayaan Bootstrap:** Baris data di-resample dengan pengembalian, model diestimasi ulang untuk setiap resample, lalu diambil persentil 2.5% dan 97.5% dari koefisien. Koefisien yang intervalnya tidak memuat nol dapat dianggap signifikan.
+    """)
+    n_resamples = resample_count(ctx, 'regression_resamples')
+    st.write(cached_regression_bootstrap(ctx.data_version, ctx.filter_key, n_resamples, day_df))
+
+    st.markdown("""
+    **Jawaban:** Hasil regresi menunjukkan bahwa suhu (`temp`) memiliki koefisien paling tinggi, artinya suhu memiliki dampak terbesar terhadap jumlah penyewaan sepeda. Diikuti oleh faktor cuaca (`weathersit`) dan kelembaban (`hum`). Kecepatan angin (`windspeed`) memiliki pengaruh yang lebih kecil terhadap jumlah pengguna sepeda.
+
+    Nilai R-Squared menunjukkan bahwa model ini mampu menjelaskan variasi data dengan cukup baik.
+    """)
+
+    # Visualisasi scatter plot antara suhu dan jumlah pengguna
+    st.subheader("Hubungan antara Suhu dan Jumlah Pengguna Sepeda")
+    st.markdown("""
+    **Penjelasan Visualisasi:** Scatter plot ini menunjukkan hubungan antara suhu (`temp`) dan jumlah pengguna sepeda. Peningkatan suhu cenderung diikuti oleh peningkatan jumlah pengguna sepeda, seperti yang ditunjukkan oleh tren garis regresi. Ini mendukung hasil dari regresi linear yang menunjukkan bahwa suhu adalah salah satu faktor yang paling signifikan mempengaruhi jumlah pengguna sepeda.
+    """)
+    ctx.show_figure('temp_scatter', figures.temp_scatter, day_df)
+
+    st.markdown("""
+    **Jawaban:** Visualisasi ini memperkuat hasil dari analisis sebelumnya bahwa suhu memiliki pengaruh besar terhadap jumlah penyewa sepeda. Terlihat bahwa semakin tinggi suhu, semakin tinggi pula jumlah pengguna sepeda.
+    """)
+
+
+# ----------------------------------------------------
+# Pertanyaan 2: Apakah ada perbedaan pola penyewaan sepeda berdasarkan musim dan hari (hari kerja vs hari libur)?
+# ----------------------------------------------------
+@section('pertanyaan_2', "Pertanyaan 2: Musim dan Hari Kerja vs Hari Libur")
+def pertanyaan_2(ctx):
+    from scipy.stats import ttest_ind
+    import figures
+
+    st = ctx.st
+    day_df = ctx.day_df
+
+    st.header("Pertanyaan 2: Apakah ada perbedaan pola penyewaan sepeda berdasarkan musim dan hari (hari kerja vs hari libur)?")
+    st.markdown("""
+    ### Langkah-langkah:
+    1. Pembagian Data: Pisahkan data menjadi hari kerja dan hari libur, serta musim yang berbeda.
+    2. Statistik Deskriptif: Melakukan perhitungan statistik deskriptif untuk melihat ringkasan data pada hari kerja dan hari libur serta musim yang berbeda.
+    3. Uji Statistik: Menggunakan T-Test untuk melihat apakah ada perbedaan signifikan dalam jumlah pengguna sepeda berdasarkan hari dan musim.
+    4. Visualisasi: Membuat visualisasi perbandingan antara musim dan hari kerja/hari libur.
+    """)
+
+    # Membagi data berdasarkan workingday dan holiday
+    workingday_data = day_df[day_df['workingday'] == 1]['cnt']
+    holiday_data = day_df[day_df['holiday'] == 1]['cnt']
+
+    # Statistik Deskriptif
+    st.subheader("Statistik Deskriptif Jumlah Pengguna Sepeda pada Hari Kerja dan Hari Libur")
+    st.markdown("""
+    **Penjelasan Hasil:** Statistik deskriptif memberikan ringkasan distribusi data untuk hari kerja dan hari libur. Kita dapat melihat bahwa jumlah pengguna sepeda lebih tinggi pada hari kerja dibandingkan hari libur, namun kita perlu melakukan uji statistik untuk mengetahui apakah perbedaan ini signifikan.
+    """)
+    st.write("Hari Kerja:", workingday_data.describe())
+    st.write("Hari Libur:", holiday_data.describe())
+
+    # Uji Statistik (T-Test) untuk Mengetahui Perbedaan Signifikan
+    st.subheader("Uji Statistik (T-Test) untuk Mengetahui Perbedaan Signifikan")
+    st.markdown("""
+    **Penjelasan Hasil:** Uji T-Test membantu kita menentukan apakah perbedaan jumlah pengguna sepeda antara hari kerja dan hari libur signifikan secara statistik. Jika nilai p-value lebih kecil dari 0.05, kita bisa menyimpulkan bahwa perbedaannya signifikan.
+    """)
+    t_stat, p_value = ttest_ind(workingday_data, holiday_data)
+    st.write(f"T-Test: t-statistic = {t_stat}, p-value = {p_value}")
+
+    st.markdown("""
+    **Jawaban:** Hasil uji T-Test menunjukkan bahwa ada perbedaan yang signifikan secara statistik antara jumlah pengguna sepeda pada hari kerja dan hari libur (p-value < 0.05). Hal ini menunjukkan bahwa pengguna sepeda cenderung lebih banyak pada hari kerja dibandingkan hari libur.
+    """)
+
+    # Uji permutasi dan bootstrap untuk semua pasangan kelompok
+    st.subheader("Uji Permutasi dan Bootstrap untuk Semua Pasangan Kelompok")
+    st.markdown("""
+    **Penjelasan Hasil:** Untuk setiap pasangan musim, pasangan kondisi cuaca, dan hari kerja vs hari libur, label kelompok diacak berulang kali (uji permutasi) untuk mendapatkan p-value selisih rata-rata tanpa asumsi distribusi normal. Interval kepercayaan 95% untuk selisih rata-rata diperoleh dari bootstrap. Ini juga menguji kesimpulan tentang musim dan cuaca ekstrem (`weathersit` = 3, Hujan).
+    """)
+    n_resamples = resample_count(ctx, 'pairwise_resamples')
+    st.dataframe(cached_pairwise_tests(ctx.data_version, ctx.filter_key, n_resamples, day_df))
+
+    # Visualisasi Perbandingan Pengguna antara Hari Kerja dan Hari Libur
+    st.subheader("Visualisasi Perbandingan Pengguna Sepeda antara Hari Kerja dan Hari Libur")
+    st.markdown("""
+    **Penjelasan Visualisasi:** Boxplot ini membantu kita memahami perbedaan distribusi jumlah pengguna sepeda pada hari kerja dan hari libur. Jika median pada hari kerja lebih tinggi daripada hari libur, hal ini menunjukkan bahwa pengguna sepeda cenderung lebih banyak pada hari kerja.
+    """)
+    ctx.show_figure('workingday_boxplot', figures.workingday_boxplot, workingday_data, holiday_data)
+
+    st.markdown("""
+    **Jawaban:** Dari boxplot di atas, terlihat bahwa median jumlah pengguna sepeda lebih tinggi pada hari kerja dibandingkan hari libur. Ini mendukung hasil dari uji statistik bahwa pengguna sepeda lebih banyak pada hari kerja daripada hari libur.
+    """)
+
+
+# ----------------------------------------------------
+# Analisis Lanjutan: Pola Penggunaan Sepeda Sepanjang Hari dalam Seminggu
+# ----------------------------------------------------
+@section('pola_mingguan', "Analisis Lanjutan: Pola Mingguan")
+def pola_mingguan(ctx):
+    import figures
+
+    st = ctx.st
+    hour_cube, filters = ctx.hour_cube, ctx.filters
+
+    st.header("Analisis Lanjutan: Pola Penggunaan Sepeda Sepanjang Hari dalam Seminggu")
+
+    st.markdown("""
+    Pada bagian ini, kita akan mengeksplorasi bagaimana pola penggunaan sepeda bervariasi berdasarkan waktu dalam sehari dan hari dalam seminggu. 
+    Ini akan memberikan gambaran kapan waktu penggunaan sepeda tertinggi dan hari mana yang memiliki jumlah pengguna tertinggi.
+    """)
+
+    # Membuat heatmap untuk melihat pola penggunaan sepeda berdasarkan jam dan hari
+    # (rata-rata dijawab dari rollup cube, bukan pivot_table atas baris mentah)
+    st.subheader("Heatmap Penggunaan Sepeda Berdasarkan Hari dan Jam")
+    ctx.show_figure('hour_weekday_heatmap', figures.hour_weekday_heatmap,
+                    hour_cube.frame('cnt', ('hr', 'weekday'), where=filters).rename(columns=WEEKDAY_LABELS))
+
+    st.markdown("""
+    **Hasil Analisis:** Dari heatmap di atas, kita dapat melihat bahwa penggunaan sepeda mencapai puncaknya pada jam sibuk, yaitu antara pukul 8 pagi hingga 9 pagi dan sore hari antara pukul 5 sore hingga 7 malam. Terlihat bahwa pada hari kerja (Senin-Jumat), penggunaan sepeda lebih tinggi dibandingkan akhir pekan (Sabtu-Minggu), terutama pada jam-jam sibuk di pagi dan sore hari.
+    """)
+
+
+# ----------------------------------------------------
+# Analisis Lanjutan: Pola Musiman Penggunaan Sepeda
+# ----------------------------------------------------
+@section('pola_musiman', "Analisis Lanjutan: Pola Musiman")
+def pola_musiman(ctx):
+    import figures
+
+    st = ctx.st
+    day_cube, filters = ctx.day_cube, ctx.filters
+
+    st.header("Analisis Lanjutan: Pola Musiman Penggunaan Sepeda")
+
+    st.markdown("""
+    Pada bagian ini, kita akan melihat bagaimana pola penggunaan sepeda bervariasi berdasarkan musim. Ini akan membantu mengidentifikasi apakah ada musim tertentu yang memiliki jumlah pengguna sepeda lebih banyak daripada yang lain.
+    """)
+
+    # Rata-rata pengguna sepeda berdasarkan musim (dari rollup cube)
+    season_avg = day_cube.frame('cnt', ('season',), where=filters).reset_index()
+
+    # Mengubah kode musim menjadi label yang lebih informatif (frame baru,
+    # hasil cube tidak diubah di tempat)
+    season_avg = season_avg.assign(season=season_avg['season'].map(SEASON_LABELS))
+
+    # Membuat visualisasi barplot
+    st.subheader("Rata-rata Jumlah Pengguna Sepeda Berdasarkan Musim")
+    ctx.show_figure('season_barplot', figures.season_barplot, season_avg)
+
+    st.markdown("""
+    **Hasil Analisis:** Visualisasi di atas menunjukkan bahwa penggunaan sepeda paling tinggi terjadi pada **Musim Panas** dan **Musim Semi**, sementara penggunaan sepeda paling rendah terjadi pada **Musim Dingin**. Hal ini mungkin disebabkan oleh cuaca yang lebih baik pada musim panas dan semi yang mendorong orang untuk lebih sering bersepeda.
+    """)
+
+
+# ----------------------------------------------------
+# Analisis Lanjutan: Pengaruh Cuaca Ekstrem terhadap Penggunaan Sepeda
+# ----------------------------------------------------
+@section('cuaca_ekstrem', "Analisis Lanjutan: Cuaca Ekstrem")
+def cuaca_ekstrem(ctx):
+    import figures
+
+    st = ctx.st
+    day_cube, filters = ctx.day_cube, ctx.filters
+
+    st.header("Analisis Lanjutan: Pengaruh Cuaca Ekstrem terhadap Penggunaan Sepeda")
+
+    st.markdown("""
+    Pada bagian ini, kita akan melihat bagaimana kondisi cuaca ekstrem (misalnya hujan lebat atau badai) memengaruhi jumlah pengguna sepeda. 
+    Apakah pengguna sepeda berkurang secara signifikan saat cuaca ekstrem terjadi?
+    """)
+
+    # Menghitung rata-rata jumlah pengguna pada hari-hari dengan cuaca ekstrem
+    # (3 = kondisi cuaca ekstrem: hujan lebat atau badai) dari rollup cube
+    weather_avg = day_cube.frame('cnt', ('weathersit',), where=filters)
+    extreme_weather_avg = weather_avg.get(3, np.nan)
+
+    # Menghitung rata-rata jumlah pengguna pada semua hari
+    overall_avg = day_cube.mean('cnt', where=filters)
+
+    # Membandingkan cuaca ekstrem dengan rata-rata keseluruhan
+    st.subheader("Pengaruh Cuaca Ekstrem terhadap Penggunaan Sepeda")
+    st.write(f"Rata-rata jumlah pengguna sepeda pada cuaca ekstrem: {extreme_weather_avg:.2f}")
+    st.write(f"Rata-rata jumlah pengguna sepeda keseluruhan: {overall_avg:.2f}")
+
+    # Visualisasi perbandingan
+    st.subheader("Perbandingan Penggunaan Sepeda pada Cuaca Ekstrem vs Rata-rata Keseluruhan")
+    ctx.show_figure('extreme_weather_barplot', figures.extreme_weather_barplot, overall_avg, extreme_weather_avg)
+
+    st.markdown("""
+    **Hasil Analisis:** Analisis ini menunjukkan bahwa jumlah pengguna sepeda secara signifikan berkurang saat terjadi cuaca ekstrem seperti hujan lebat atau badai. Rata-rata pengguna sepeda pada hari-hari dengan cuaca ekstrem jauh lebih rendah daripada rata-rata keseluruhan. Hal ini wajar karena cuaca buruk membuat orang enggan untuk bersepeda.
+    """)
+
+
+# ----------------------------------------------------
+# Eksplorasi Rentang Waktu (indeks waktu dengan prefix sum)
+# ----------------------------------------------------
+@section('rentang_waktu', "Eksplorasi Rentang Waktu")
+def rentang_waktu(ctx):
+    import pandas as pd
+
+    st = ctx.st
+    _, hour_time = ctx.state.time_indexes()
+
+    st.header("Eksplorasi Rentang Waktu")
+
+    st.markdown("""
+    Pilih rentang tanggal untuk melihat total dan rata-rata per jam di dalam rentang tersebut. 
+    Semua angka dihitung dari indeks waktu (prefix sum per jam), sehingga tetap cepat walaupun data mencakup banyak tahun. 
+    Filter di sidebar tidak berlaku di bagian ini; rincian per musim dan per hari ditampilkan di tabel.
+    """)
+
+    first, last = (pd.Timestamp(t).date() for t in hour_time.span())
+    start, end = st.slider("Rentang Tanggal", min_value=first, max_value=last, value=(first, last),
+                           format="DD/MM/YYYY", key='rentang_tanggal')
+    # Tanggal akhir ikut dihitung: jendela [start, end + 1 hari)
+    start, end = pd.Timestamp(start), pd.Timestamp(end) + pd.Timedelta(days=1)
+
+    st.subheader("Ringkasan Rentang Terpilih")
+    st.write(f"Jumlah jam tercatat: {hour_time.count(start, end)}")
+    stats = pd.DataFrame({
+        'Total': [hour_time.total(m, start, end) for m in ('cnt', 'casual', 'registered')],
+        'Rata-rata per Jam': [hour_time.mean(m, start, end) for m in ('cnt', 'casual', 'registered')],
+    }, index=['cnt', 'casual', 'registered'])
+    st.dataframe(stats)
+    weather = pd.Series({m: hour_time.mean(m, start, end) for m in ('temp', 'atemp', 'hum', 'windspeed')},
+                        name='Rata-rata (ternormalisasi)')
+    st.dataframe(weather)
+
+    # Rata-rata cnt per jam untuk setiap musim dan hari di dalam rentang
+    for group, labels, title in (('season', SEASON_LABELS, "Musim"), ('weekday', WEEKDAY_LABELS, "Hari")):
+        summary = hour_time.summary(group, start, end).rename(index=labels)
+        summary.index.name = title
+        summary.columns = ['Jumlah Jam', 'Total cnt', 'Rata-rata cnt per Jam']
+        st.subheader(f"Penggunaan Sepeda per {title} dalam Rentang")
+        st.dataframe(summary)
+
+
+# ----------------------------------------------------
+# Kesimpulan Akhir dari Analisis
+# ----------------------------------------------------
+@section('kesimpulan', "Kesimpulan Akhir")
+def kesimpulan(ctx):
+    st = ctx.st
+
+    st.header("Kesimpulan Akhir dari Analisis")
+    st.markdown("""
+    ### Kesimpulan dari Pertanyaan 1:
+    - Faktor yang paling mempengaruhi jumlah pengguna sepeda adalah suhu (`temp`). Berdasarkan analisis korelasi dan regresi, suhu memiliki pengaruh paling besar terhadap jumlah total pengguna sepeda dalam sehari. Kelembaban (`hum`) dan kecepatan angin (`windspeed`) juga berpengaruh, tetapi dalam skala yang lebih kecil.
+    - Korelasi dan scatter plot mendukung bahwa semakin tinggi suhu, semakin tinggi pula jumlah pengguna sepeda.
+
+    ### Kesimpulan dari Pertanyaan 2:
+    - Berdasarkan hasil uji statistik, terdapat perbedaan yang signifikan dalam jumlah pengguna sepeda antara hari kerja dan hari libur. Hari kerja cenderung memiliki lebih banyak pengguna sepeda dibandingkan hari libur, yang dapat dilihat dari statistik deskriptif dan visualisasi boxplot.
+    - P-value dari uji T-Test kurang dari 0.05, yang berarti perbedaan tersebut signifikan secara statistik.
+
+    ### Kesimpulan dari Analisis Lanjutan:
+    1. **Pola Penggunaan Sepeda Sepanjang Hari dalam Seminggu:** 
+       - Penggunaan sepeda paling tinggi terjadi pada jam sibuk (pagi dan sore hari) pada hari kerja.
+       - Penggunaan sepeda menurun pada akhir pekan dan tidak ada puncak penggunaan yang signifikan.
+
+    2. **Pola Musiman Penggunaan Sepeda:** 
+       - Penggunaan sepeda paling tinggi pada Musim Panas dan Musim Semi.
+       - Penggunaan sepeda paling rendah terjadi pada Musim Dingin.
+
+    3. **Pengaruh Cuaca Ekstrem:** 
+       - Cuaca ekstrem secara signifikan mengurangi jumlah pengguna sepeda.
+       - Rata-rata pengguna sepeda jauh lebih rendah pada hari-hari dengan hujan lebat atau badai dibandingkan dengan rata-rata keseluruhan.
+    """)
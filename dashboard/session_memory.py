@@ -0,0 +1,106 @@
+# ----------------------------------------------------
+# Pengukuran memori per sesi: membandingkan load_data dengan st.cache_data
+# (setiap sesi menerima salinan hasil unpickle) dan st.cache_resource (semua
+# sesi memakai frame memmap read-only yang sama). Setiap mode dijalankan di
+# proses baru; N sesi bersamaan disimulasikan dengan memanggil loader N kali
+# dan menyimpan hasilnya, lalu pertumbuhan memori anonim (heap, RssAnon) dan
+# memori file (halaman memmap, RssFile) dicatat.
+#
+# Cara pakai (dari folder dashboard):
+#   python session_memory.py [--sessions 20] [--rows 1e6] [--json hasil.json]
+# ----------------------------------------------------
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+_CHILD = r'''
+import json, os, sys, tracemalloc
+import streamlit as st
+from dataset_store import load_frame
+
+mode, directory, sessions = sys.argv[1], sys.argv[2], int(sys.argv[3])
+
+def memory():
+    fields = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if name in ('RssAnon', 'RssFile'):
+                fields[name] = int(value.split()[0]) * 1024
+    return fields
+
+cache = st.cache_data if mode == 'cache_data' else st.cache_resource
+
+@cache
+def load_data():
+    return (load_frame(os.path.join(directory, 'day.csv'), table='day'),
+            load_frame(os.path.join(directory, 'hour.csv'), table='hour'))
+
+def touch(frames):
+    for df in frames:
+        for name in df.columns:
+            if df[name].dtype.kind in 'if':
+                df[name].to_numpy().sum()
+
+touch(load_data())
+before = memory()
+tracemalloc.start()
+held = []
+for _ in range(sessions):
+    frames = load_data()
+    touch(frames)
+    held.append(frames)
+traced = tracemalloc.get_traced_memory()[0]
+after = memory()
+print(json.dumps({
+    'mode': mode,
+    'sessions': sessions,
+    'anon_bytes': after['RssAnon'] - before['RssAnon'],
+    'file_bytes': after['RssFile'] - before['RssFile'],
+    'traced_bytes': traced,
+    'shared_objects': len({id(frames[1]) for frames in held}),
+}))
+'''
+
+
+def measure(mode, directory, sessions):
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=here + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    output = subprocess.run([sys.executable, '-c', _CHILD, mode, directory, str(sessions)],
+                            cwd=here, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Perbandingan memori per sesi')
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--rows', type=float, default=None,
+                        help='pakai data sintetis dengan jumlah baris hour ini')
+    parser.add_argument('--json', default=None)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = os.path.dirname(os.path.abspath(__file__))
+        if args.rows:
+            import synthetic
+            synthetic.write_dataset(tmp, int(args.rows))
+            directory = tmp
+        results = [measure(mode, directory, args.sessions) for mode in ('cache_data', 'cache_resource')]
+
+    print("%-16s %8s %14s %14s %14s %8s" % ('mode', 'sesi', 'anon/sesi', 'file total', 'traced/sesi', 'objek'))
+    for row in results:
+        print("%-16s %8d %11.2f MB %11.2f MB %11.2f MB %8d" % (
+            row['mode'], row['sessions'], row['anon_bytes'] / row['sessions'] / 2 ** 20,
+            row['file_bytes'] / 2 ** 20, row['traced_bytes'] / row['sessions'] / 2 ** 20,
+            row['shared_objects']))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
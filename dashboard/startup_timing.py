@@ -0,0 +1,74 @@
+# ----------------------------------------------------
+# Harness pengukuran waktu startup dashboard. Setiap bagian dijalankan
+# di proses Python baru (cache dingin) memakai streamlit.testing AppTest,
+# lalu dicatat waktu run pertama (time-to-first-paint), waktu CPU, dan
+# library berat yang ikut terimpor. Opsi "semua" setara dengan perilaku
+# lama yang menghitung seluruh bagian sekaligus.
+#
+# Cara pakai (dari folder dashboard):  python startup_timing.py [--json hasil.json]
+# ----------------------------------------------------
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ('sklearn', 'scipy', 'seaborn', 'matplotlib')
+
+_CHILD = r'''
+import json, resource, sys, time
+from streamlit.testing.v1 import AppTest
+
+section = sys.argv[1]
+at = AppTest.from_file('dashboard.py', default_timeout=600)
+at.query_params['bagian'] = section
+usage = resource.getrusage(resource.RUSAGE_SELF)
+start = time.perf_counter()
+at.run()
+wall = time.perf_counter() - start
+after = resource.getrusage(resource.RUSAGE_SELF)
+cpu = (after.ru_utime - usage.ru_utime) + (after.ru_stime - usage.ru_stime)
+
+start = time.perf_counter()
+at.run()
+rerun = time.perf_counter() - start
+
+print(json.dumps({
+    'section': section,
+    'first_run_seconds': wall,
+    'first_run_cpu_seconds': cpu,
+    'rerun_seconds': rerun,
+    'errors': [str(e.value) for e in at.exception],
+    'heavy_modules': sorted(m for m in %r if m in sys.modules),
+}))
+''' % (HEAVY_MODULES,)
+
+
+def measure_section(section, directory):
+    env = dict(os.environ, PYTHONPATH=directory + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    output = subprocess.run([sys.executable, '-c', _CHILD, section], cwd=directory, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv):
+    directory = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, directory)
+    from sections import SECTIONS
+
+    results = [measure_section(key, directory) for key in list(SECTIONS) + ['semua']]
+
+    print("%-16s %10s %10s %10s  %s" % ('bagian', 'run-1 (s)', 'cpu (s)', 'rerun (s)', 'impor berat'))
+    for row in results:
+        print("%-16s %10.2f %10.2f %10.2f  %s" % (
+            row['section'], row['first_run_seconds'], row['first_run_cpu_seconds'],
+            row['rerun_seconds'], ', '.join(row['heavy_modules']) or '-'))
+        if row['errors']:
+            print("    error: %s" % '; '.join(row['errors']))
+
+    if '--json' in argv:
+        with open(argv[argv.index('--json') + 1], 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
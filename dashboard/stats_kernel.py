@@ -0,0 +1,313 @@
+# ----------------------------------------------------
+# Kernel statistik vektor untuk semua kolom numerik sekaligus. Data dibaca
+# per blok baris (memori terbatas pada ukuran blok, bukan jumlah baris) dan
+# setiap blok diproses untuk semua kolom bersamaan:
+# - sapuan 1: jumlah, nilai hilang, total, min, max,
+# - sapuan 2: momen terpusat (2-4), matriks ko-momen untuk korelasi,
+#   histogram halus (sketsa) dengan SKETCH_BINS bin di [min, max] dan bobot
+#   linear binning di tepi-tepi bin tersebut (masukan KDE).
+# Dari sketsa diturunkan kuantil, histogram tampilan (aturan 'auto' numpy,
+# sama dengan sns.histplot) dan kurva KDE Gaussian (bandwidth Scott seperti
+# scipy.stats.gaussian_kde) lewat konvolusi FFT di grid sketsa. Grafik cukup
+# menggambar array hasil kernel, tanpa KDE/histogram ulang atas baris mentah.
+# Biaya O(n * k) untuk n baris dan k kolom, ditambah O(k * G log G).
+#
+# Cara pakai (dari folder dashboard):  python stats_kernel.py [day.csv hour.csv]
+# (membandingkan hasil kernel dengan pandas/numpy/scipy/seaborn)
+# ----------------------------------------------------
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# 5040 punya banyak pembagi, sehingga histogram tampilan dengan jumlah bin
+# mendekati aturan 'auto' bisa disusun dari gabungan bin sketsa yang utuh
+SKETCH_BINS = 5040
+BLOCK_ROWS = 1 << 16
+# Sama dengan bawaan seaborn untuk garis KDE di histplot (gridsize=200, cut=0)
+KDE_GRIDSIZE = 200
+# Kernel Gaussian dipotong pada 5 bandwidth
+KDE_TRUNCATE = 5.0
+
+_DIVISORS = np.array([d for d in range(1, SKETCH_BINS + 1) if SKETCH_BINS % d == 0])
+
+
+def numeric_columns(df):
+    return [name for name in df.columns if df[name].dtype.kind in 'iufb']
+
+
+# Blok baris sebagai array float64 (baris x kolom); kolom diambil sebagai
+# view (tanpa salinan frame), hanya blok yang sedang diproses yang disalin
+def _blocks(df, columns, block_rows):
+    arrays = [df[name].to_numpy() for name in columns]
+    for start in range(0, len(df), block_rows):
+        block = np.empty((min(block_rows, len(df) - start), len(arrays)))
+        for j, values in enumerate(arrays):
+            block[:, j] = values[start:start + block_rows]
+        yield block
+
+
+class ColumnStats:
+    # Hasil kernel untuk satu frame: momen, korelasi, sketsa histogram,
+    # histogram tampilan dan kurva KDE per kolom
+
+    def __init__(self, columns, rows, sketch_bins=SKETCH_BINS):
+        self.columns = list(columns)
+        self.rows = rows
+        self.sketch_bins = sketch_bins
+        k = len(self.columns)
+        self.count = np.zeros(k)
+        self.total = np.zeros(k)
+        self.low = np.full(k, np.inf)
+        self.high = np.full(k, -np.inf)
+        self.central = np.zeros((3, k))  # jumlah (x - mean)^2, ^3, ^4
+        self.comoment = np.zeros((k, k))
+        self.sketch = np.zeros((k, sketch_bins), dtype=np.int64)
+        self.nodes = np.zeros((k, sketch_bins + 1))
+
+    # Sapuan 1: ukuran, total dan rentang setiap kolom
+    def _first_pass(self, X):
+        present = ~np.isnan(X)
+        self.count += present.sum(axis=0)
+        self.total += np.where(present, X, 0.0).sum(axis=0)
+        if len(X):
+            self.low = np.fmin(self.low, np.nanmin(np.where(present, X, np.inf), axis=0))
+            self.high = np.fmax(self.high, np.nanmax(np.where(present, X, -np.inf), axis=0))
+
+    # Rentang sketsa; kolom konstan diperlebar 0.5 seperti np.histogram
+    def _range(self):
+        low, high = self.low.copy(), self.high.copy()
+        flat = high <= low
+        low[flat] -= 0.5
+        high[flat] += 0.5
+        return low, high
+
+    # Sapuan 2: momen terpusat, ko-momen, sketsa histogram dan linear
+    # binning (bincount untuk semua kolom sekaligus dengan offset per kolom)
+    def _second_pass(self, X):
+        centered = X - self.mean
+        missing = np.isnan(centered)
+        centered[missing] = 0.0
+        power = centered * centered
+        self.central[0] += power.sum(axis=0)
+        self.central[1] += (power * centered).sum(axis=0)
+        self.central[2] += (power * power).sum(axis=0)
+        self.comoment += centered.T @ centered
+
+        low, high = self._range()
+        G, k = self.sketch_bins, len(self.columns)
+        step = (high - low) / G
+        X = np.where(missing, low, X)
+        position = (X - low) / step
+        index = np.clip(np.floor(position), 0, G - 1).astype(np.int64)
+        # Koreksi tepi seperti np.histogram: bandingkan dengan tepi linspace
+        index -= X < index * step + low
+        upper = np.where(index + 1 >= G, high, (index + 1) * step + low)
+        index += (X >= upper) & (index < G - 1)
+        present = ~missing
+        self.sketch += np.bincount((index + np.arange(k) * G)[present], minlength=k * G).reshape(k, G)
+
+        # Linear binning: bobot titik dibagi ke dua tepi bin terdekat
+        node = np.clip(np.floor(position), 0, G - 1).astype(np.int64)
+        fraction = np.clip(position - node, 0.0, 1.0)
+        node = (node + np.arange(k) * (G + 1))[present]
+        fraction = fraction[present]
+        self.nodes += (np.bincount(node, 1.0 - fraction, minlength=k * (G + 1))
+                       + np.bincount(node + 1, fraction, minlength=k * (G + 1))).reshape(k, G + 1)
+
+    @property
+    def mean(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.total / self.count
+
+    # Tabel momen: mean, var/std (ddof=1 seperti pandas), skew dan kurtosis
+    # (bias=True, fisher=True seperti scipy.stats)
+    def moments(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            m2, m3, m4 = self.central / self.count
+            var = self.central[0] / (self.count - 1)
+            return pd.DataFrame({
+                'count': self.count, 'mean': self.mean, 'var': var, 'std': np.sqrt(var),
+                'min': self.low, 'max': self.high,
+                'skew': m3 / m2 ** 1.5, 'kurtosis': m4 / m2 ** 2 - 3.0,
+            }, index=self.columns)
+
+    @property
+    def missing(self):
+        return pd.Series(self.rows - self.count, index=self.columns).astype(np.int64)
+
+    # Jumlah nilai hilang untuk semua kolom frame; kolom non-numerik
+    # (mis. dteday) dihitung langsung
+    def missing_counts(self, df):
+        return pd.Series({name: int(self.missing[name]) if name in self.columns else int(df[name].isnull().sum())
+                          for name in df.columns})
+
+    # Matriks korelasi Pearson dari ko-momen terpusat. Nilai hilang tidak
+    # ikut menyumbang (dianggap sama dengan rata-rata kolomnya).
+    @property
+    def corr(self):
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            matrix = self.comoment / np.outer(scale, scale)
+        np.fill_diagonal(matrix, np.where(scale > 0, 1.0, np.nan))
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+    def _edges(self, j):
+        low, high = self._range()
+        return np.linspace(low[j], high[j], self.sketch_bins + 1)
+
+    # Kuantil dari sketsa: interpolasi linear di dalam bin (galat peringkat
+    # paling banyak sebesar isi satu bin)
+    def quantile(self, q):
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        result = {}
+        for j, name in enumerate(self.columns):
+            if not self.count[j]:
+                result[name] = np.full(len(q), np.nan)
+                continue
+            cumulative = np.r_[0, np.cumsum(self.sketch[j])]
+            value = np.interp(q * self.count[j], cumulative, self._edges(j))
+            result[name] = np.clip(value, self.low[j], self.high[j])
+        return pd.DataFrame(result, index=q)
+
+    # Jumlah bin aturan 'auto' numpy (min(Freedman-Diaconis, Sturges)),
+    # dibulatkan ke pembagi SKETCH_BINS terdekat
+    def display_bins(self, column):
+        j = self.columns.index(column)
+        n, span = self.count[j], self.high[j] - self.low[j]
+        if n < 2 or span <= 0:
+            return 1
+        q1, q3 = self.quantile([0.25, 0.75])[column]
+        # IQR di bawah resolusi sketsa (data diskret) dianggap nol
+        iqr = q3 - q1 if q3 - q1 >= span / self.sketch_bins else 0.0
+        sturges = span / (np.log2(n) + 1.0)
+        fd = 2.0 * iqr * n ** (-1.0 / 3.0)
+        width = min(fd, sturges) if fd > 0 else sturges
+        wanted = int(np.ceil(span / width))
+        return int(_DIVISORS[np.argmin(np.abs(_DIVISORS - wanted) - 1e-9 * _DIVISORS)])
+
+    # Histogram tampilan (counts, edges), digabung dari bin sketsa
+    def histogram(self, column, bins=None):
+        j = self.columns.index(column)
+        bins = bins or self.display_bins(column)
+        if self.sketch_bins % bins:
+            raise ValueError("jumlah bin harus membagi %d" % self.sketch_bins)
+        counts = self.sketch[j].reshape(bins, -1).sum(axis=1)
+        return counts, self._edges(j)[::self.sketch_bins // bins]
+
+    # Bandwidth Scott seperti scipy.stats.gaussian_kde: std * n^(-1/5)
+    def bandwidth(self, column):
+        j = self.columns.index(column)
+        return np.sqrt(self.central[0][j] / (self.count[j] - 1)) * self.count[j] ** -0.2
+
+    # Kurva KDE (x, y) di grid seaborn (gridsize titik di [min, max]). Bobot
+    # linear binning dikonvolusi dengan kernel Gaussian lewat FFT, lalu diinterpolasi
+    # ke grid. scale='density' memberi kepadatan, scale='count' menskalakan
+    # kurva ke tinggi histogram (n * lebar bin) seperti histplot(kde=True).
+    def kde(self, column, scale='density', bins=None, gridsize=KDE_GRIDSIZE):
+        j = self.columns.index(column)
+        bw = self.bandwidth(column)
+        grid = np.linspace(self.low[j], self.high[j], gridsize)
+        if not np.isfinite(bw) or bw <= 0:
+            return grid, np.full(gridsize, np.nan)
+
+        G = self.sketch_bins
+        edges = self._edges(j)
+        step = edges[1] - edges[0]
+        reach = min(int(np.ceil(KDE_TRUNCATE * bw / step)), G)
+        offsets = np.arange(-reach, reach + 1) * step
+        kernel = np.exp(-0.5 * (offsets / bw) ** 2) / (bw * np.sqrt(2 * np.pi) * self.count[j])
+
+        # Konvolusi linear (bukan sirkular): panjang FFT >= G + 1 + 2 * reach
+        size = 1 << int(np.ceil(np.log2(G + 1 + 2 * reach)))
+        density = np.fft.irfft(np.fft.rfft(self.nodes[j], size) * np.fft.rfft(kernel, size), size)
+        density = density[:G + 1 + 2 * reach]
+        positions = edges[0] + np.arange(-reach, G + 1 + reach) * step
+        values = np.interp(grid, positions, np.maximum(density, 0.0))
+
+        if scale == 'count':
+            counts, hist_edges = self.histogram(column, bins)
+            values = values * counts.sum() * (hist_edges[1] - hist_edges[0])
+        return grid, values
+
+
+# Fungsi utama: statistik semua kolom numerik (atau `columns`) dari df
+def column_stats(df, columns=None, block_rows=BLOCK_ROWS, sketch_bins=SKETCH_BINS):
+    columns = list(columns) if columns is not None else numeric_columns(df)
+    stats = ColumnStats(columns, len(df), sketch_bins)
+    for X in _blocks(df, columns, block_rows):
+        stats._first_pass(X)
+    for X in _blocks(df, columns, block_rows):
+        stats._second_pass(X)
+    return stats
+
+
+# Fungsi untuk membandingkan hasil kernel dengan pandas/numpy/scipy/seaborn.
+# Mengembalikan DataFrame: satu baris per (kolom, pemeriksaan).
+def verify(df, columns=None):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from scipy import stats as scipy_stats
+
+    stats = column_stats(df, columns)
+    moments = stats.moments()
+    rows = []
+
+    def check(column, name, error, tolerance):
+        rows.append({'column': column, 'check': name, 'error': float(error), 'tolerance': tolerance,
+                     'ok': bool(error <= tolerance)})
+
+    expected_corr = df[stats.columns].corr()
+    check('*', 'corr vs pandas', np.nanmax(np.abs(stats.corr - expected_corr).to_numpy()), 1e-9)
+    for column in stats.columns:
+        values = df[column].dropna().to_numpy(dtype=np.float64)
+        check(column, 'missing vs isnull', abs(stats.missing[column] - df[column].isnull().sum()), 0)
+        scale = max(abs(values).max(), 1.0)
+        check(column, 'mean vs pandas', abs(moments.at[column, 'mean'] - values.mean()) / scale, 1e-12)
+        check(column, 'std vs numpy', abs(moments.at[column, 'std'] - values.std(ddof=1)) / scale, 1e-12)
+        if values.std() > 0:
+            check(column, 'skew vs scipy', abs(moments.at[column, 'skew'] - scipy_stats.skew(values)), 1e-9)
+            check(column, 'kurtosis vs scipy',
+                  abs(moments.at[column, 'kurtosis'] - scipy_stats.kurtosis(values)), 1e-9)
+
+        # Kuantil: galat peringkat dibandingkan isi bin sketsa terbesar
+        quantiles = stats.quantile([0.05, 0.25, 0.5, 0.75, 0.95])[column]
+        rank_error = max(abs(np.mean(values <= value) - q) for q, value in quantiles.items())
+        check(column, 'quantile rank error', rank_error, (stats.sketch[stats.columns.index(column)].max() + 1) / len(values))
+
+        # Histogram: sama persis dengan np.histogram pada tepi yang sama
+        counts, edges = stats.histogram(column)
+        check(column, 'histogram vs numpy', np.abs(counts - np.histogram(values, edges)[0]).max(), 0)
+        check(column, 'bins vs auto', abs(len(counts) - (len(np.histogram_bin_edges(values, 'auto')) - 1)),
+              max(1, 0.1 * len(counts)))
+
+        # KDE: kurva seaborn (histplot kde=True, skala hitungan) pada tepi bin yang sama
+        if values.std() > 0:
+            fig, ax = plt.subplots()
+            sns.histplot(values, bins=edges, kde=True, ax=ax)
+            expected = ax.lines[0].get_ydata()
+            plt.close(fig)
+            curve = stats.kde(column, scale='count')[1]
+            check(column, 'kde vs seaborn', np.abs(curve - expected).max() / expected.max(), 1e-3)
+    return pd.DataFrame(rows)
+
+
+if __name__ == '__main__':
+    from dataset_store import load_frame
+
+    paths = sys.argv[1:] or ['day.csv', 'hour.csv']
+    for path in paths:
+        table = 'hour' if 'hour' in path else 'day'
+        df = load_frame(path, table=table)
+        start = time.perf_counter()
+        column_stats(df)
+        elapsed = time.perf_counter() - start
+        result = verify(df)
+        failed = result[~result['ok']]
+        print("%s: %d kolom, %d baris, kernel %.4fs, %d/%d pemeriksaan lolos" % (
+            path, len(numeric_columns(df)), len(df), elapsed, int(result['ok'].sum()), len(result)))
+        if len(failed):
+            print(failed.to_string(index=False))
@@ -0,0 +1,179 @@
+# ----------------------------------------------------
+# Generator data sintetis day.csv/hour.csv yang secara statistik mirip
+# dengan dataset asli, untuk benchmark di atas 10^5 - 10^8 baris per jam.
+# Parameter (cuaca per bulan, kondisi cuaca per musim, profil per jam,
+# porsi pengguna casual, regresi cnt harian) diestimasi dari dataset asli.
+# Data dibangkitkan per blok hari sehingga file besar bisa ditulis ke CSV
+# tanpa menampung semuanya di memori. Beberapa kota disimulasikan dengan
+# kolom tambahan `city`.
+#
+# Cara pakai:  python synthetic.py <folder-tujuan> <jumlah-baris-hour> [jumlah-kota]
+# ----------------------------------------------------
+import math
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+WEATHER_COLUMNS = ('temp', 'atemp', 'hum', 'windspeed')
+START_DATE = '2011-01-01'
+# Hari ke-n dalam setahun saat musim berganti (semi, panas, gugur, dingin)
+SEASON_STARTS = (80, 172, 266, 355)
+MAX_YEARS_PER_CITY = 10
+CHUNK_DAYS = 20000
+
+
+# Fungsi untuk mengestimasi parameter generator dari dataset asli
+def fit_profile(day_df, hour_df):
+    by_month = day_df.groupby('mnth')[list(WEATHER_COLUMNS)]
+    weathersit = pd.crosstab(day_df['season'], day_df['weathersit'], normalize='index')
+    weathersit = weathersit.reindex(index=range(1, 5), columns=range(1, 5), fill_value=0)
+
+    hourly = hour_df.groupby(['workingday', 'hr'])['cnt'].mean().unstack().reindex(columns=range(24))
+    hourly = hourly.fillna(0).to_numpy()
+    casual_share = hour_df.groupby('workingday')['casual'].sum() / hour_df.groupby('workingday')['cnt'].sum()
+    temp_offset = (hour_df.groupby('hr')['temp'].mean() - hour_df['temp'].mean()).reindex(range(24))
+
+    X = np.column_stack([np.ones(len(day_df))] + [day_df[c] for c in
+                        ('temp', 'hum', 'windspeed', 'weathersit', 'yr', 'workingday')])
+    y = day_df['cnt'].to_numpy(dtype=np.float64)
+    beta = np.linalg.lstsq(X, y, rcond=None)[0]
+
+    return {
+        'weather_mean': by_month.mean().reindex(range(1, 13)).to_numpy(),
+        'weather_std': by_month.std().reindex(range(1, 13)).to_numpy(),
+        'weathersit_probs': weathersit.to_numpy(),
+        'hour_share': hourly / hourly.sum(axis=1, keepdims=True),
+        'casual_share': casual_share.reindex([0, 1]).to_numpy(),
+        'temp_offset': temp_offset.fillna(0).to_numpy(),
+        'beta': beta,
+        'residual_std': float(np.std(y - X @ beta)),
+        'holiday_rate': float(day_df['holiday'].mean()),
+    }
+
+
+def load_profile(directory='.'):
+    return fit_profile(pd.read_csv(os.path.join(directory, 'day.csv')),
+                       pd.read_csv(os.path.join(directory, 'hour.csv')))
+
+
+def _sample_categorical(rng, probs):
+    # probs: (n, k) probabilitas per baris -> indeks kategori 0..k-1
+    cumulative = probs.cumsum(axis=1)
+    draws = rng.random((len(probs), 1)) * cumulative[:, -1:]
+    return (draws > cumulative).sum(axis=1)
+
+
+# Fungsi untuk membangkitkan satu blok hari: days_index adalah nomor hari
+# sejak START_DATE untuk tiap baris, city adalah id kota tiap baris
+def _generate_block(rng, profile, days_index, city, instant_day, instant_hour):
+    n = len(days_index)
+    dates = pd.Timestamp(START_DATE) + pd.to_timedelta(days_index, unit='D')
+    mnth = dates.month.to_numpy()
+    doy = dates.dayofyear.to_numpy()
+    season = np.searchsorted(SEASON_STARTS, doy, side='right')
+    season = np.where(season == 4, 1, season + 1)
+    yr = dates.year.to_numpy() - pd.Timestamp(START_DATE).year
+    weekday = (dates.dayofweek.to_numpy() + 1) % 7
+    holiday = (rng.random(n) < profile['holiday_rate']).astype(np.int64)
+    workingday = ((weekday >= 1) & (weekday <= 5) & (holiday == 0)).astype(np.int64)
+    weathersit = _sample_categorical(rng, profile['weathersit_probs'][season - 1]) + 1
+
+    mean = profile['weather_mean'][mnth - 1]
+    std = profile['weather_std'][mnth - 1]
+    weather = np.clip(mean + std * rng.standard_normal((n, len(WEATHER_COLUMNS))), 0, 1)
+    weather[:, 2] = np.clip(weather[:, 2] + 0.05 * (weathersit - 1), 0, 1)
+
+    # Level harian dari regresi dataset asli; pertumbuhan antar tahun dibatasi
+    beta = profile['beta']
+    level = (beta[0] + beta[1] * weather[:, 0] + beta[2] * weather[:, 2] + beta[3] * weather[:, 3]
+             + beta[4] * weathersit + beta[5] * np.minimum(yr, 1) + beta[6] * workingday
+             + profile['residual_std'] * rng.standard_normal(n))
+    level = np.maximum(level, 20)
+
+    # Baris per jam: 24 jam untuk setiap hari
+    hr = np.tile(np.arange(24), n)
+    rep = np.repeat(np.arange(n), 24)
+    share = profile['hour_share'][workingday[rep], hr]
+    cnt = rng.poisson(level[rep] * share)
+    casual = rng.binomial(cnt, profile['casual_share'][workingday[rep]])
+    hour_weather = weather[rep] + 0.02 * rng.standard_normal((len(rep), len(WEATHER_COLUMNS)))
+    hour_weather[:, 0] += profile['temp_offset'][hr]
+    hour_weather[:, 1] += profile['temp_offset'][hr]
+    hour_weather = np.clip(hour_weather, 0, 1).round(4)
+    hour_weathersit = np.clip(weathersit[rep] + (rng.random(len(rep)) < 0.1) * rng.choice([-1, 1], len(rep)), 1, 4)
+
+    dteday = dates.strftime('%Y-%m-%d').to_numpy()
+    hour_df = pd.DataFrame({
+        'instant': instant_hour + np.arange(len(rep)),
+        'dteday': dteday[rep], 'season': season[rep], 'yr': yr[rep], 'mnth': mnth[rep], 'hr': hr,
+        'holiday': holiday[rep], 'weekday': weekday[rep], 'workingday': workingday[rep],
+        'weathersit': hour_weathersit,
+        'temp': hour_weather[:, 0], 'atemp': hour_weather[:, 1],
+        'hum': hour_weather[:, 2], 'windspeed': hour_weather[:, 3],
+        'casual': casual, 'registered': cnt - casual, 'cnt': cnt,
+    })
+
+    # Data harian = agregasi data per jam (konsisten seperti dataset asli)
+    day_cnt = cnt.reshape(n, 24).sum(axis=1)
+    day_casual = casual.reshape(n, 24).sum(axis=1)
+    day_df = pd.DataFrame({
+        'instant': instant_day + np.arange(n),
+        'dteday': dteday, 'season': season, 'yr': yr, 'mnth': mnth, 'holiday': holiday,
+        'weekday': weekday, 'workingday': workingday, 'weathersit': weathersit,
+        'temp': weather[:, 0].round(6), 'atemp': weather[:, 1].round(6),
+        'hum': weather[:, 2].round(6), 'windspeed': weather[:, 3].round(6),
+        'casual': day_casual, 'registered': day_cnt - day_casual, 'cnt': day_cnt,
+    })
+    if city is not None:
+        hour_df.insert(1, 'city', city[rep])
+        day_df.insert(1, 'city', city)
+    return day_df, hour_df
+
+
+# Generator blok (day_df, hour_df) untuk total `hour_rows` baris per jam
+def iter_blocks(hour_rows, cities=None, seed=0, profile=None, chunk_days=CHUNK_DAYS):
+    profile = profile or load_profile()
+    total_days = max(1, math.ceil(hour_rows / 24))
+    if cities is None:
+        cities = max(1, math.ceil(total_days / (MAX_YEARS_PER_CITY * 365)))
+    days_per_city = math.ceil(total_days / cities)
+    rng = np.random.default_rng(seed)
+
+    instant_day = instant_hour = 1
+    for start in range(0, total_days, chunk_days):
+        stop = min(start + chunk_days, total_days)
+        flat = np.arange(start, stop)
+        city = flat // days_per_city if cities > 1 else None
+        day_df, hour_df = _generate_block(rng, profile, flat % days_per_city, city,
+                                          instant_day, instant_hour)
+        instant_day += len(day_df)
+        instant_hour += len(hour_df)
+        yield day_df, hour_df
+
+
+def generate(hour_rows, cities=None, seed=0, profile=None):
+    blocks = list(iter_blocks(hour_rows, cities, seed, profile))
+    day_df = pd.concat([b[0] for b in blocks], ignore_index=True)
+    hour_df = pd.concat([b[1] for b in blocks], ignore_index=True)
+    return day_df, hour_df
+
+
+# Fungsi untuk menulis day.csv dan hour.csv sintetis secara bertahap
+def write_dataset(directory, hour_rows, cities=None, seed=0, profile=None):
+    os.makedirs(directory, exist_ok=True)
+    day_path = os.path.join(directory, 'day.csv')
+    hour_path = os.path.join(directory, 'hour.csv')
+    for i, (day_df, hour_df) in enumerate(iter_blocks(hour_rows, cities, seed, profile)):
+        mode = 'w' if i == 0 else 'a'
+        day_df.to_csv(day_path, mode=mode, header=(i == 0), index=False)
+        hour_df.to_csv(hour_path, mode=mode, header=(i == 0), index=False)
+    return day_path, hour_path
+
+
+if __name__ == '__main__':
+    target = sys.argv[1]
+    rows = int(float(sys.argv[2]))
+    n_cities = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    print(write_dataset(target, rows, n_cities))
@@ -0,0 +1,250 @@
+# ----------------------------------------------------
+# Indeks waktu untuk eksplorasi rentang tanggal. Baris diurutkan menurut
+# timestamp (dteday + hr), lalu disimpan prefix sum (cumsum) untuk cnt,
+# casual, registered dan kolom cuaca. Total/rata-rata jendela [start, end)
+# cukup dua binary search dan dua pengurangan: O(log n), tanpa memindai baris.
+#
+# Ringkasan per musim/hari juga dijawab dalam O(log n): musim dan hari
+# ditentukan oleh tanggal, sehingga cukup prefix sum per tanggal untuk hari
+# yang utuh di dalam jendela, ditambah dua hari tepi (sebagian) dari prefix
+# sum per jam.
+#
+# Semua array disimpan sebagai AppendArray, sehingga batch baru (IngestState)
+# menghasilkan indeks baru yang memakai bersama array indeks lama.
+# ----------------------------------------------------
+import numpy as np
+import pandas as pd
+
+from append_array import AppendArray
+
+TIME_MEASURES = ('cnt', 'casual', 'registered', 'temp', 'atemp', 'hum', 'windspeed')
+# Kolom yang nilainya sama untuk semua baris pada tanggal yang sama
+TIME_GROUPS = ('season', 'weekday', 'workingday')
+HOUR = np.timedelta64(1, 'h')
+
+
+def timestamps(df):
+    times = pd.to_datetime(df['dteday']).to_numpy(dtype='datetime64[ns]')
+    if 'hr' in df.columns:
+        times = times + np.asarray(df['hr'], dtype=np.int64) * HOUR
+    return times
+
+
+def _prefix(values):
+    # Kolom bilangan bulat dijumlahkan sebagai int64 agar hasilnya eksak
+    dtype = np.int64 if values.dtype.kind in 'iub' else np.float64
+    result = np.zeros(len(values) + 1, dtype=dtype)
+    np.cumsum(values, out=result[1:], dtype=dtype)
+    return result
+
+
+# Banyak baris dan total cnt per tanggal, dari batas [bounds[d], bounds[d + 1])
+def _day_totals(cnt_prefix, bounds):
+    return np.diff(bounds), np.diff(cnt_prefix[bounds])
+
+
+# Baris ke-d: base + jumlah bobot tanggal sebelum d, per level kelompok
+def _running(day_codes, levels, weights, base):
+    steps = (day_codes[:, None] == np.arange(len(levels))) * weights[:, None]
+    return base + np.cumsum(steps, axis=0) - steps
+
+
+def _group_arrays(levels, day_codes, rows_per_day, cnt_per_day):
+    zero = np.zeros(len(levels), dtype=np.int64)
+    return (levels, AppendArray(day_codes), AppendArray(_running(day_codes, levels, rows_per_day, zero)),
+            AppendArray(_running(day_codes, levels, cnt_per_day, zero)))
+
+
+class TimeIndex:
+    def __init__(self, df, measures=TIME_MEASURES, groups=TIME_GROUPS):
+        times = timestamps(df)
+        order = np.argsort(times, kind='stable')
+        prefix = {m: _prefix(np.asarray(df[m])[order]) for m in measures if m in df.columns}
+        codes = {g: np.asarray(df[g], dtype=np.int64)[order] for g in groups if g in df.columns}
+        cities = np.asarray(df['city'])[order] if 'city' in df.columns else None
+        self._build(times[order], prefix, codes, cities)
+
+    # Menyusun indeks dari baris yang sudah terurut: prefix sum per kolom,
+    # kode kelompok per baris, dan kota per baris (None jika tidak ada)
+    def _build(self, times, prefix, codes, cities):
+        self._times = AppendArray(times)
+        self._prefix = {m: AppendArray(values) for m, values in prefix.items()}
+        self._cities = None if cities is None else AppendArray(cities)
+
+        # Batas tanggal: baris [day_start[d], day_start[d + 1]) berada di tanggal ke-d
+        days = times.astype('datetime64[D]')
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]]) if len(times) else np.zeros(0, np.int64)
+        self._days = AppendArray(days[starts])
+        self._day_start = AppendArray(starts)
+
+        self._groups = {}
+        if len(times) and 'cnt' in prefix:
+            rows_per_day, cnt_per_day = _day_totals(prefix['cnt'], np.r_[starts, len(times)])
+            for group, values in codes.items():
+                low = np.minimum.reduceat(values, starts)
+                if not np.array_equal(low, np.maximum.reduceat(values, starts)):
+                    continue  # nilai berbeda dalam satu tanggal: tidak bisa diindeks per tanggal
+                levels, day_codes = np.unique(low, return_inverse=True)
+                self._groups[group] = _group_arrays(levels, day_codes, rows_per_day, cnt_per_day)
+        self._publish()
+
+    # Array yang dibaca kueri: tampilan sepanjang versi ini dari buffer bersama
+    def _publish(self):
+        self.times = self._times.values
+        self.rows = len(self.times)
+        self.prefix = {m: values.values for m, values in self._prefix.items()}
+        self.measures = tuple(self.prefix)
+        self.cities = None if self._cities is None else self._cities.values
+        self.days = self._days.values
+        self.day_start = self._day_start.values
+        self.levels = {g: arrays[0] for g, arrays in self._groups.items()}
+        self.day_codes = {g: arrays[1].values for g, arrays in self._groups.items()}
+        # group_counts[g][d]: banyak baris per level untuk tanggal sebelum d
+        self.group_counts = {g: arrays[2].values for g, arrays in self._groups.items()}
+        self.group_sums = {g: arrays[3].values for g, arrays in self._groups.items()}
+
+    # Fungsi untuk membuat indeks baru yang juga mencakup baris df; indeks ini
+    # tidak berubah. Batch setelah timestamp terakhir cukup menyambung prefix
+    # sum (biaya sebanding dengan batch); batch yang jatuh di tengah histori
+    # disisipkan dengan merge dua urutan terurut (O(n), tanpa mengurutkan ulang).
+    def extended(self, df):
+        if not self.rows:
+            return TimeIndex(df, self.measures)
+        times = timestamps(df)
+        order = np.argsort(times, kind='stable')
+        times = times[order]
+        prefix = {m: _prefix(np.asarray(df[m])[order]) for m in self.measures}
+        codes = {g: np.asarray(df[g], dtype=np.int64)[order] for g in self.levels}
+        cities = None if self.cities is None else np.asarray(df['city'])[order]
+
+        if not len(times):
+            return self
+        result = object.__new__(TimeIndex)
+        if times[0] < self.times[-1]:
+            result._merge(self, times, prefix, codes, cities)
+        else:
+            result._append(self, times, prefix, codes, cities)
+        return result
+
+    def _append(self, old, times, prefix, codes, cities):
+        self._times = old._times.extend(times)
+        self._prefix = {m: values.extend(old.prefix[m][-1] + prefix[m][1:])
+                        for m, values in old._prefix.items()}
+        self._cities = None if old._cities is None else old._cities.extend(cities)
+
+        # Tanggal terakhir lama bisa berlanjut di batch, jadi batas tanggal
+        # dihitung ulang mulai dari awal tanggal terakhir lama
+        first = old.day_start[-1]
+        tail_days = self._times.values[first:].astype('datetime64[D]')
+        offsets = np.flatnonzero(np.r_[True, tail_days[1:] != tail_days[:-1]])
+        self._days = old._days.extend(tail_days[offsets[1:]])
+        self._day_start = old._day_start.extend(first + offsets[1:])
+
+        self._groups = {}
+        if 'cnt' in self._prefix:
+            rows = len(self._times.values)
+            rows_per_day, cnt_per_day = _day_totals(self._prefix['cnt'].values, np.r_[first + offsets, rows])
+            for group, (levels, day_codes, counts, sums) in old._groups.items():
+                # Kode per baris di ekor: baris lama pada tanggal terakhir + batch
+                tail = np.r_[np.full(old.rows - first, levels[day_codes.values[-1]]), codes[group]]
+                low = np.minimum.reduceat(tail, offsets)
+                if not np.array_equal(low, np.maximum.reduceat(tail, offsets)):
+                    continue
+                if not np.isin(low, levels).all():
+                    # Level baru: array per tanggal disusun ulang (O(jumlah tanggal))
+                    all_codes = np.r_[levels[day_codes.values[:-1]], low]
+                    all_levels, all_day_codes = np.unique(all_codes, return_inverse=True)
+                    self._groups[group] = _group_arrays(
+                        all_levels, all_day_codes,
+                        *_day_totals(self._prefix['cnt'].values, np.r_[self._day_start.values, rows]))
+                    continue
+                tail_codes = np.searchsorted(levels, low)
+                self._groups[group] = (
+                    levels, day_codes.extend(tail_codes[1:]),
+                    counts.extend(_running(tail_codes, levels, rows_per_day, counts.values[-1])[1:]),
+                    sums.extend(_running(tail_codes, levels, cnt_per_day, sums.values[-1])[1:]))
+        self._publish()
+
+    def _merge(self, old, times, prefix, codes, cities):
+        positions = np.searchsorted(old.times, times, side='right')
+        from_batch = np.insert(np.zeros(old.rows, dtype=bool), positions, True)
+        # Prefix gabungan = prefix lama sampai baris lama ke-a + prefix batch sampai baris ke-b
+        b = np.r_[0, np.cumsum(from_batch)]
+        a = np.arange(len(b)) - b
+        rows_per_day = np.diff(np.r_[old.day_start, old.rows])
+        old_codes = {g: np.repeat(old.levels[g][old.day_codes[g]], rows_per_day) for g in old.levels}
+        self._build(np.insert(old.times, positions, times),
+                    {m: old.prefix[m][a] + prefix[m][b] for m in old.measures},
+                    {g: np.insert(old_codes[g], positions, codes[g]) for g in old.levels},
+                    None if cities is None else np.insert(old.cities, positions, cities))
+
+    # Fungsi untuk memeriksa baris mana (timestamp, dan kota bila ada) yang
+    # sudah ada di indeks; dua binary search per baris yang diperiksa
+    def contains(self, times, cities=None):
+        lo = np.searchsorted(self.times, times, side='left')
+        hi = np.searchsorted(self.times, times, side='right')
+        if cities is None or self.cities is None:
+            return hi > lo
+        # Baris lama dengan timestamp sama (satu per kota) dibandingkan kotanya
+        width = hi - lo
+        starts = np.cumsum(width) - width
+        positions = np.repeat(lo - starts, width) + np.arange(width.sum())
+        same = self.cities[positions] == np.repeat(cities, width)
+        found = np.zeros(len(times), dtype=bool)
+        hit = width > 0
+        found[hit] = np.logical_or.reduceat(same, starts[hit])
+        return found
+
+    # Rentang waktu data: (timestamp pertama, timestamp terakhir)
+    def span(self):
+        return self.times[0], self.times[-1]
+
+    # Posisi baris [lo, hi) untuk jendela waktu [start, end)
+    def bounds(self, start, end):
+        lo, hi = np.searchsorted(self.times, np.array([start, end], dtype='datetime64[ns]'))
+        return int(lo), int(max(lo, hi))
+
+    def count(self, start, end):
+        lo, hi = self.bounds(start, end)
+        return hi - lo
+
+    def total(self, measure, start, end):
+        lo, hi = self.bounds(start, end)
+        return self.prefix[measure][hi] - self.prefix[measure][lo]
+
+    def mean(self, measure, start, end):
+        lo, hi = self.bounds(start, end)
+        if hi == lo:
+            return np.nan
+        return (self.prefix[measure][hi] - self.prefix[measure][lo]) / (hi - lo)
+
+    # Ringkasan cnt per kelompok (musim, hari, ...) di dalam jendela:
+    # DataFrame dengan kolom count, sum, mean; kelompok tanpa data dibuang
+    def summary(self, group, start, end):
+        lo, hi = self.bounds(start, end)
+        levels = self.levels[group]
+        counts = np.zeros(len(levels), dtype=np.int64)
+        sums = np.zeros(len(levels), dtype=np.int64)
+        cnt = self.prefix['cnt']
+
+        if hi > lo:
+            first = int(np.searchsorted(self.day_start, lo, side='right')) - 1
+            last = int(np.searchsorted(self.day_start, hi - 1, side='right')) - 1
+            if first == last:
+                counts[self.day_codes[group][first]] += hi - lo
+                sums[self.day_codes[group][first]] += cnt[hi] - cnt[lo]
+            else:
+                # Hari utuh di antara kedua tepi dari prefix sum per tanggal
+                counts += self.group_counts[group][last] - self.group_counts[group][first + 1]
+                sums += self.group_sums[group][last] - self.group_sums[group][first + 1]
+                # Sebagian hari pertama dan terakhir dari prefix sum per baris
+                edge = self.day_start[first + 1]
+                counts[self.day_codes[group][first]] += edge - lo
+                sums[self.day_codes[group][first]] += cnt[edge] - cnt[lo]
+                edge = self.day_start[last]
+                counts[self.day_codes[group][last]] += hi - edge
+                sums[self.day_codes[group][last]] += cnt[hi] - cnt[edge]
+
+        result = pd.DataFrame({'count': counts, 'sum': sums}, index=pd.Index(levels, name=group))
+        result['mean'] = result['sum'] / result['count'].where(result['count'] > 0)
+        return result[result['count'] > 0]